@@ -5,7 +5,7 @@ Centralized error handling for Epic Events CLI application
 import click
 import logging
 from typing import Any, Callable, Optional
-from functools import wraps
+from functools import lru_cache, wraps
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError, DisconnectionError
 from utils.validators import ValidationError
 from utils.permissions import PermissionError
@@ -35,158 +35,179 @@ class BusinessLogicError(CLIError):
     """Business logic error"""
 
 
-def handle_cli_errors(func: Callable) -> Callable:
-    """
-    Decorator to handle CLI errors with user-friendly messages
-    """
+def _handle_permission_error(e: PermissionError, command: str) -> None:
+    click.echo(click.style(f"Access denied: {e}", fg="red", bold=True))
+    click.echo(
+        click.style(
+            "Tip: Check that you have the necessary"
+            "permissions for this action.",
+            fg="yellow",
+        )
+    )
+    logger.warning(f"Permission denied in {command}: {e}")
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
 
-        except PermissionError as e:
-            click.echo(click.style(f"Access denied: {e}", fg="red", bold=True))
-            click.echo(
-                click.style(
-                    "Tip: Check that you have the necessary"
-                    "permissions for this action.",
-                    fg="yellow",
-                )
-            )
-            logger.warning(f"Permission denied in {func.__name__}: {e}")
-            raise click.Abort()
+def _handle_validation_error(e: ValidationError, command: str) -> None:
+    click.echo(click.style(f" Invalid data: {e}", fg="red", bold=True))
+    click.echo(
+        click.style(
+            "Tip: Check the format of your data (email, phone, amounts, etc.)",
+            fg="yellow",
+        )
+    )
+    logger.warning(f"Validation error in {command}: {e}")
 
-        except ValidationError as e:
-            click.echo(click.style(f" Invalid data: {e}", fg="red", bold=True))
-            click.echo(
-                click.style(
-                    "Tip: Check the format of your data (email, phone, amounts, etc.)",
-                    fg="yellow",
-                )
-            )
-            logger.warning(f"Validation error in {func.__name__}: {e}")
-            raise click.Abort()
 
-        except IntegrityError as e:
-            click.echo(
-                click.style(
-                    "Data conflict: This operation violates a database constraint.",
-                    fg="red",
-                    bold=True,
-                )
-            )
-            if "email" in str(e).lower():
-                click.echo(
-                    click.style("This email address is already in use.", fg="yellow")
-                )
-            elif "employee_number" in str(e).lower():
-                click.echo(
-                    click.style("This employee number already exists.", fg="yellow")
-                )
-            else:
-                click.echo(
-                    click.style(
-                        "Check that the data doesn't already exist.", fg="yellow"
-                    )
-                )
-            logger.error(f"Integrity error in {func.__name__}: {e}")
-            raise click.Abort()
+def _handle_integrity_error(e: IntegrityError, command: str) -> None:
+    click.echo(
+        click.style(
+            "Data conflict: This operation violates a database constraint.",
+            fg="red",
+            bold=True,
+        )
+    )
+    if "email" in str(e).lower():
+        click.echo(click.style("This email address is already in use.", fg="yellow"))
+    elif "employee_number" in str(e).lower():
+        click.echo(click.style("This employee number already exists.", fg="yellow"))
+    else:
+        click.echo(
+            click.style("Check that the data doesn't already exist.", fg="yellow")
+        )
+    logger.error(f"Integrity error in {command}: {e}")
 
-        except DisconnectionError as e:
-            click.echo(
-                click.style(
-                    "Connection error: Unable to connect to the database.",
-                    fg="red",
-                    bold=True,
-                )
-            )
-            click.echo(
-                click.style(
-                    "Check that the database is accessible and"
-                    "connection settings are correct.",
-                    fg="yellow",
-                )
-            )
-            logger.error(f"Database connection error in {func.__name__}: {e}")
-            raise click.Abort()
 
-        except SQLAlchemyError as e:
-            click.echo(
-                click.style(
-                    "Database error: An error occurred while accessing data.",
-                    fg="red",
-                    bold=True,
-                )
-            )
-            click.echo(
-                click.style(
-                    "This error has been logged. Contact the administrator"
-                    "if the problem persists.",
-                    fg="yellow",
-                )
-            )
-            logger.error(f"SQLAlchemy error in {func.__name__}: {e}")
-            raise click.Abort()
+def _handle_disconnection_error(e: DisconnectionError, command: str) -> None:
+    click.echo(
+        click.style(
+            "Connection error: Unable to connect to the database.",
+            fg="red",
+            bold=True,
+        )
+    )
+    click.echo(
+        click.style(
+            "Check that the database is accessible and"
+            "connection settings are correct.",
+            fg="yellow",
+        )
+    )
+    logger.error(f"Database connection error in {command}: {e}")
 
-        except ResourceNotFoundError as e:
-            click.echo(
-                click.style(f"Resource not found: {e.message}", fg="red", bold=True)
-            )
-            click.echo(
-                click.style(
-                    "Check the ID or use the 'list' command"
-                    "to see available resources.",
-                    fg="yellow",
-                )
-            )
-            logger.warning(f"Resource not found in {func.__name__}: {e}")
-            raise click.Abort()
 
-        except BusinessLogicError as e:
-            click.echo(click.style(f"Business error: {e.message}", fg="red", bold=True))
-            click.echo(
-                click.style(
-                    "This action is not allowed in the current context.", fg="yellow"
-                )
-            )
-            logger.warning(f"Business logic error in {func.__name__}: {e}")
-            raise click.Abort()
+def _handle_sqlalchemy_error(e: SQLAlchemyError, command: str) -> None:
+    click.echo(
+        click.style(
+            "Database error: An error occurred while accessing data.",
+            fg="red",
+            bold=True,
+        )
+    )
+    click.echo(
+        click.style(
+            "This error has been logged. Contact the administrator"
+            "if the problem persists.",
+            fg="yellow",
+        )
+    )
+    logger.error(f"SQLAlchemy error in {command}: {e}")
 
-        except DatabaseConnectionError as e:
-            click.echo(
-                click.style(f"Database connection: {e.message}", fg="red", bold=True)
-            )
-            click.echo(
-                click.style("Check connection settings in config.py", fg="yellow")
-            )
-            logger.error(f"Database connection error in {func.__name__}: {e}")
-            raise click.Abort()
 
-        except KeyboardInterrupt:
-            click.echo(
-                click.style("Operation cancelled by user.", fg="yellow", bold=True)
-            )
-            raise click.Abort()
+def _handle_resource_not_found(e: ResourceNotFoundError, command: str) -> None:
+    click.echo(click.style(f"Resource not found: {e.message}", fg="red", bold=True))
+    click.echo(
+        click.style(
+            "Check the ID or use the 'list' command"
+            "to see available resources.",
+            fg="yellow",
+        )
+    )
+    logger.warning(f"Resource not found in {command}: {e}")
 
-        except Exception as e:
-            # Log l'erreur inattendue dans Sentry avec contexte
-            context = {
-                "command": func.__name__,
-                "args_preview": str(args)[:200] if args else "None",
-                "kwargs_preview": str(kwargs)[:200] if kwargs else "None",
-            }
-            log_unexpected_error(e, context)
-
-            click.echo(click.style(f"Unexpected error: {str(e)}", fg="red", bold=True))
-            click.echo(
-                click.style(
-                    "This error has been logged for investigation."
-                    "Contact the administrator.",
-                    fg="yellow",
-                )
-            )
-            logger.error(f"Unexpected error in {func.__name__}: {e}", exc_info=True)
+
+def _handle_business_logic_error(e: BusinessLogicError, command: str) -> None:
+    click.echo(click.style(f"Business error: {e.message}", fg="red", bold=True))
+    click.echo(
+        click.style("This action is not allowed in the current context.", fg="yellow")
+    )
+    logger.warning(f"Business logic error in {command}: {e}")
+
+
+def _handle_database_connection_error(
+    e: DatabaseConnectionError, command: str
+) -> None:
+    click.echo(click.style(f"Database connection: {e.message}", fg="red", bold=True))
+    click.echo(click.style("Check connection settings in config.py", fg="yellow"))
+    logger.error(f"Database connection error in {command}: {e}")
+
+
+def _handle_keyboard_interrupt(e: KeyboardInterrupt, command: str) -> None:
+    click.echo(click.style("Operation cancelled by user.", fg="yellow", bold=True))
+
+
+# Handler for each known error type
+_ERROR_HANDLERS = {
+    PermissionError: _handle_permission_error,
+    ValidationError: _handle_validation_error,
+    IntegrityError: _handle_integrity_error,
+    DisconnectionError: _handle_disconnection_error,
+    SQLAlchemyError: _handle_sqlalchemy_error,
+    ResourceNotFoundError: _handle_resource_not_found,
+    BusinessLogicError: _handle_business_logic_error,
+    DatabaseConnectionError: _handle_database_connection_error,
+    KeyboardInterrupt: _handle_keyboard_interrupt,
+}
+
+
+@lru_cache(maxsize=64)
+def _find_error_handler(error_type: type) -> Optional[Callable]:
+    """
+    Return the handler for an error type, None for unexpected errors
+    The most specific class wins (IntegrityError before SQLAlchemyError)
+    """
+    for cls in error_type.__mro__:
+        handler = _ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _handle_unexpected_error(e: Exception, command: str, args, kwargs) -> None:
+    # Log l'erreur inattendue dans Sentry avec contexte
+    context = {
+        "command": command,
+        "args_preview": str(args)[:200] if args else "None",
+        "kwargs_preview": str(kwargs)[:200] if kwargs else "None",
+    }
+    log_unexpected_error(e, context)
+
+    click.echo(click.style(f"Unexpected error: {str(e)}", fg="red", bold=True))
+    click.echo(
+        click.style(
+            "This error has been logged for investigation."
+            "Contact the administrator.",
+            fg="yellow",
+        )
+    )
+    logger.error(f"Unexpected error in {command}: {e}", exc_info=True)
+
+
+def handle_cli_errors(func: Callable) -> Callable:
+    """
+    Decorator to handle CLI errors with user-friendly messages
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+
+        except (Exception, KeyboardInterrupt) as e:
+            handler = _find_error_handler(type(e))
+            if handler is None:
+                _handle_unexpected_error(e, func.__name__, args, kwargs)
+            else:
+                handler(e, func.__name__)
             raise click.Abort()
 
     return wrapper
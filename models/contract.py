@@ -21,8 +21,12 @@ class Contract(Base):
     # Relationships
     customer = relationship("Customer", back_populates="contracts")
     sales_contact = relationship("Employee", back_populates="contracts")
+    # passive_deletes: the database removes events through ON DELETE CASCADE
     events = relationship(
-        "Event", back_populates="contract", cascade="all, delete-orphan"
+        "Event",
+        back_populates="contract",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -21,11 +21,19 @@ class Customer(Base):
 
     # Relationships
     sales_contact = relationship("Employee", back_populates="customers")
+    # passive_deletes: the database removes children through ON DELETE CASCADE,
+    # the ORM does not load them first
     contracts = relationship(
-        "Contract", back_populates="customer", cascade="all, delete-orphan"
+        "Contract",
+        back_populates="customer",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     events = relationship(
-        "Event", back_populates="customer", cascade="all, delete-orphan"
+        "Event",
+        back_populates="customer",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -30,9 +30,16 @@ class Employee(Base):
 
     # Relationships
     employee_role = relationship("Role", back_populates="employees")
-    customers = relationship("Customer", back_populates="sales_contact")
-    contracts = relationship("Contract", back_populates="sales_contact")
-    events_support = relationship("Event", back_populates="support_contact")
+    # passive_deletes: the database clears these links through ON DELETE SET NULL
+    customers = relationship(
+        "Customer", back_populates="sales_contact", passive_deletes=True
+    )
+    contracts = relationship(
+        "Contract", back_populates="sales_contact", passive_deletes=True
+    )
+    events_support = relationship(
+        "Event", back_populates="support_contact", passive_deletes=True
+    )
 
     @property
     def role(self):
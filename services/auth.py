@@ -15,22 +15,35 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Argon2 production parameters
+HASH_TIME_COST = 3  # Number of iterations
+HASH_MEMORY_COST = 65536  # Memory used (64 MB)
+HASH_PARALLELISM = 1  # Number of parallel threads
+HASH_LEN = 32  # Length of the hash
+SALT_LEN = 16  # Length of the salt
+
+
 class AuthenticationError(Exception):
     """Custom exception for authentication errors"""
 
 
+def _build_password_hasher() -> PasswordHasher:
+    """Build the Argon2 hasher with the production parameters"""
+    return PasswordHasher(
+        time_cost=HASH_TIME_COST,
+        memory_cost=HASH_MEMORY_COST,
+        parallelism=HASH_PARALLELISM,
+        hash_len=HASH_LEN,
+        salt_len=SALT_LEN,
+    )
+
+
 class AuthService:
     """Service for user authentication and password management"""
 
     def __init__(self):
-        # Configure Argon2 parameters
-        self.ph = PasswordHasher(
-            time_cost=3,  # Number of iterations
-            memory_cost=65536,  # Memory used (64 MB)
-            parallelism=1,  # Number of parallel threads
-            hash_len=32,  # Length of the hash
-            salt_len=16,  # Length of the salt
-        )
+        # Argon2 hasher with the production parameters
+        self.ph = _build_password_hasher()
         self.max_attempts = 5
         self.lockout_duration = timedelta(minutes=15)
 
@@ -222,9 +235,10 @@ class AuthService:
             )
 
             session.add(employee)
-            session.commit()
+            session.flush()
 
-            # Get the data we need before closing the session
+            # Get the data we need before committing: the id comes back from
+            # the INSERT, so no reload of the expired instance is needed
             employee_data = {
                 "id": employee.id,
                 "employee_number": employee.employee_number,
@@ -232,6 +246,7 @@ class AuthService:
                 "email": employee.email,
                 "role_id": employee.role_id,
             }
+            session.commit()
 
             logger.info(f"Created employee {employee_number} - {name}")
             return employee_data
@@ -176,9 +176,11 @@ class AuthenticationManager:
             return False
 
         # Get full employee object for permission check
+        # Role is loaded in the same query since has_permission reads it
         session = Session()
         try:
             employee = (session.query(Employee)
+                        .options(joinedload(Employee.employee_role))
                         .filter(Employee.id == self.current_user["id"])
                         .first())
             if not employee:
@@ -1,19 +1,31 @@
 """
-Centralized configuration of PostgreSQL test fixtures
-Tests run against the same type of database as production
+Centralized configuration of test database fixtures
+Tests run against an in-memory SQLite database by default,
+set DB_TEST_BACKEND=postgresql to run them against PostgreSQL like production
 """
+import logging
 import os
 import pytest
+from contextlib import contextmanager
+from pathlib import Path
 from unittest.mock import patch
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, select, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
+from argon2 import PasswordHasher
 from models.base import Base
 import models
+import services.auth
+
+logger = logging.getLogger(__name__)
 
 # Charger les variables d'environnement
 load_dotenv()
 
+# Backend de la base de test : "sqlite" (en mémoire) ou "postgresql"
+DB_TEST_BACKEND = os.getenv("DB_TEST_BACKEND", "sqlite").lower()
+
 # Configuration base de données de test PostgreSQL
 DB_TEST_USER = os.getenv("DB_TEST_USER", os.getenv("DB_USER"))
 DB_TEST_PASSWORD = os.getenv("DB_TEST_PASSWORD", os.getenv("DB_PASSWORD"))
@@ -21,6 +33,96 @@ DB_TEST_HOST = os.getenv("DB_TEST_HOST", os.getenv("DB_HOST", "localhost"))
 DB_TEST_PORT = os.getenv("DB_TEST_PORT", os.getenv("DB_PORT", "5433"))
 DB_TEST_NAME = os.getenv("DB_TEST_NAME", "epic_events_test")
 
+# Worker pytest-xdist courant (gw0, gw1...), None hors exécution parallèle
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+# Fabrique de sessions de test, liée à la connexion de chaque test
+TestingSession = sessionmaker()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "db: test uses the test database")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Mark every test depending on the test database with "db"
+    so pure tests can run alone with: pytest -m "not db"
+    """
+    for item in items:
+        if "test_engine" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.db)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    Number of workers for "pytest -n auto"
+    The suite is small: more than 4 workers costs more in startup than it saves
+    """
+    return min(4, os.cpu_count() or 1)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Argon2 at its minimal cost for every AuthService built during the tests
+    Tests do not depend on its strength
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            services.auth,
+            "_build_password_hasher",
+            lambda: PasswordHasher(time_cost=1, memory_cost=8, parallelism=1),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def password_hash(fast_password_hashing):
+    """
+    Argon2 hash of the test password, computed once for the session
+    For employees inserted directly, without going through AuthService
+    """
+    return services.auth.AuthService().hash_password("TestPassword123!")
+
+
+@pytest.fixture(scope="session")
+def sample_employee_data():
+    """Employee data as carried in JWT tokens and the authentication session"""
+    return {
+        "id": 1,
+        "employee_number": "EMP001",
+        "name": "Test User",
+        "email": "test@example.com",
+        "role": "admin",
+        "role_id": 4,
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jwt_secret():
+    """
+    JWT signing secret shared by the whole session
+    Without it JWTService generates one and writes it to .env in the working tree
+    """
+    secret = "test_jwt_secret"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("EPIC_EVENTS_JWT_SECRET", secret)
+        yield secret
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_home(tmp_path_factory):
+    """
+    Home directory shared by the whole session
+    AuthenticationManager stores its token file there, never in the real one
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Path, "home", classmethod(lambda cls: home))
+        yield home
+
 
 def get_test_database_url():
     """Build the PostgreSQL test database URL"""
@@ -30,21 +132,76 @@ def get_test_database_url():
     )
 
 
+def create_sqlite_test_engine():
+    """
+    Build an in-memory SQLite engine for tests
+    StaticPool keeps the single connection alive so every session
+    sees the same database
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Let SQLAlchemy drive transactions so SAVEPOINT works with pysqlite
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def create_postgresql_test_engine():
+    """
+    Build the PostgreSQL test engine
+    Under pytest-xdist each worker uses its own schema, so workers
+    sharing the test database do not drop each other's tables
+    """
+    engine = create_engine(get_test_database_url(), echo=False)
+
+    if XDIST_WORKER:
+        schema = f"test_{XDIST_WORKER}"
+
+        @event.listens_for(engine, "connect")
+        def set_search_path(dbapi_connection, connection_record):
+            # Outside a transaction, otherwise the pool reset would undo it
+            existing_autocommit = dbapi_connection.autocommit
+            dbapi_connection.autocommit = True
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+            cursor.execute(f'SET SESSION search_path TO "{schema}"')
+            cursor.close()
+            dbapi_connection.autocommit = existing_autocommit
+
+    return engine
+
+
 @pytest.fixture(scope="session")
 def test_engine():
     """
-    PostgreSQL engine for tests - shared for the session
+    Database engine for tests - shared for the session
     Created once per test session
     """
-    test_url = get_test_database_url()
-    engine = create_engine(test_url, echo=False)
+    if DB_TEST_BACKEND == "postgresql":
+        engine = create_postgresql_test_engine()
+    else:
+        engine = create_sqlite_test_engine()
 
     # Verify the connection
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
     except Exception as e:
-        pytest.skip(f"PostgreSQL test database not available: {e}")
+        pytest.skip(f"Test database not available: {e}")
 
     # Create tables once for the session
     Base.metadata.drop_all(engine)
@@ -73,14 +230,12 @@ def test_engine():
                      description="System administrator - Full system access")
             ]
 
-            for role in base_roles:
-                session.add(role)
-
+            session.add_all(base_roles)
             session.commit()
-            print(f"Created {len(base_roles)} base roles for tests")
+            logger.debug(f"Created {len(base_roles)} base roles for tests")
     except Exception as e:
         session.rollback()
-        print(f"Error creating base roles: {e}")
+        logger.error(f"Error creating base roles: {e}")
     finally:
         session.close()
 
@@ -91,39 +246,71 @@ def test_engine():
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def test_db(test_engine):
+@pytest.fixture(scope="session")
+def base_role_ids(test_engine):
     """
-    PostgreSQL session for tests with automatic rollback
-    Each test uses its own transaction which is rolled back
+    IDs of the base roles created by test_engine, keyed by role name
+    Read once for the session: base roles never change afterwards
     """
-    # Create a connection and start a transaction
-    connection = test_engine.connect()
-    transaction = connection.begin()
+    from models import Role
+    with test_engine.connect() as connection:
+        rows = connection.execute(select(Role.name, Role.id))
+        return {name: role_id for name, role_id in rows}
 
-    # Create session factory bound to this connection
-    SessionClass = sessionmaker(bind=connection)
-    session = SessionClass()
 
-    # Patch modules that use Session
-    patches = [
-        patch.object(models, 'Session', lambda: session),
-        patch('services.auth.Session', lambda: session),
-        patch('repositories.base.Session', lambda: session),
-    ]
+@pytest.fixture(scope="session")
+def outer_transaction(test_engine):
+    """
+    Open a TestingSession inside an outer transaction, rolled back on exit
+    The in-memory SQLite engine shares a single connection (StaticPool),
+    so only one outer transaction can be open at a time: a class or module
+    fixture holding one must not be combined with test_db
+    """
+    open_transactions = []
 
-    # Start all patches
-    for p in patches:
-        p.start()
+    @contextmanager
+    def begin():
+        if open_transactions:
+            raise RuntimeError(
+                "An outer test transaction is already open, "
+                "only one can be open at a time"
+            )
+        connection = test_engine.connect()
+        transaction = connection.begin()
+        open_transactions.append(transaction)
+        session = TestingSession(bind=connection)
+        try:
+            yield session
+        finally:
+            open_transactions.pop()
+            session.close()
+            transaction.rollback()
+            connection.close()
 
-    try:
-        yield session
-    finally:
-        # Stop all patches
+    return begin
+
+
+@pytest.fixture(scope="function")
+def test_db(outer_transaction):
+    """
+    Database session for tests with automatic rollback
+    Each test uses its own transaction which is rolled back
+    """
+    with outer_transaction() as session:
+        # Patch modules that use Session
+        patches = [
+            patch.object(models, 'Session', lambda: session),
+            patch('services.auth.Session', lambda: session),
+            patch('repositories.base.Session', lambda: session),
+        ]
+
+        # Start all patches
         for p in patches:
-            p.stop()
+            p.start()
 
-        # Rollback the transaction (undo all changes)
-        session.close()
-        transaction.rollback()
-        connection.close()
+        try:
+            yield session
+        finally:
+            # Stop all patches
+            for p in patches:
+                p.stop()
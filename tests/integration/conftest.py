@@ -1,12 +1,15 @@
 """
 Configure fixtures for integration tests
-Integration tests with real PostgreSQL database
+Integration tests run against the test database (in-memory SQLite by default,
+PostgreSQL with DB_TEST_BACKEND=postgresql)
 """
 
 # Les fixtures de base sont héritées du conftest.py parent
 # Ce fichier peut contenir des fixtures spécifiques aux tests d'intégration
 
 import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.orm import Session
 from services.auth import AuthService
 from repositories.customer import CustomerRepository
 from repositories.employee import EmployeeRepository
@@ -26,6 +29,16 @@ def integration_repos(test_db):
 
 
 @pytest.fixture
+def empty_query_db():
+    """Mock database session whose get_all() query chain returns no rows"""
+    mock_db = MagicMock(spec=Session)
+    mock_db.configure_mock(
+        **{"query.return_value.order_by.return_value.all.return_value": []}
+    )
+    return mock_db
+
+
+@pytest.fixture(scope="session")
 def auth_service_integration():
     """Authentication service for integration tests"""
     return AuthService()
@@ -3,6 +3,8 @@ Tests for Authentication Manager
 Tests session management, login/logout functionality, and token persistence
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -10,14 +12,24 @@ from pathlib import Path
 from services.auth_manager import AuthenticationManager
 from utils.permissions import Permission
 
+# Result of the employee query made by require_permission
+EMPLOYEE_QUERY_RESULT = (
+    "query.return_value.options.return_value.filter.return_value.first.return_value"
+)
+
 
 class TestAuthenticationManager:
     """Test suite for Authentication Manager"""
 
     @pytest.fixture
-    def auth_manager(self):
-        """Create authentication manager instance"""
-        return AuthenticationManager()
+    def auth_manager(self, tmp_path):
+        """
+        Create authentication manager instance
+        Tokens go to a temporary file, never to the real one in the home directory
+        """
+        manager = AuthenticationManager()
+        manager.token_file = tmp_path / ".epic_events_tokens"
+        return manager
 
     @pytest.fixture
     def mock_auth_service(self):
@@ -31,21 +43,12 @@ class TestAuthenticationManager:
         mock = MagicMock()
         return mock
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """Sample employee data"""
-        return {
-            "id": 1,
-            "employee_number": "EMP001",
-            "name": "Test User",
-            "email": "test@example.com",
-            "role": "admin",
-            "role_id": 4,
-        }
-
     @pytest.fixture
     def sample_tokens(self):
-        """Sample JWT tokens"""
+        """
+        Sample JWT tokens
+        Built for each test: a token refresh updates the dict in place
+        """
         return {
             "access_token": "fake_access_token",
             "refresh_token": "fake_refresh_token",
@@ -66,17 +69,14 @@ class TestAuthenticationManager:
             return_value=(True, sample_employee_data, "Login successful")
         )
 
-        # Mock JWT token creation
-        auth_manager.jwt_service.create_access_token = MagicMock(
-            return_value="access_token"
-        )
-        auth_manager.jwt_service.create_refresh_token = MagicMock(
-            return_value="refresh_token"
+        # Mock JWT token creation, both tokens in one configured mock
+        auth_manager.jwt_service = MagicMock(
+            **{
+                "create_access_token.return_value": "access_token",
+                "create_refresh_token.return_value": "refresh_token",
+            }
         )
 
-        # Mock token saving
-        auth_manager._save_tokens = MagicMock()
-
         result = auth_manager.login("EMP001", "password123")
 
         assert result["success"] is True
@@ -84,6 +84,9 @@ class TestAuthenticationManager:
         assert auth_manager.current_user == sample_employee_data
         assert "Welcome Test User" in result["message"]
 
+        # Tokens are really written, to the temporary token file
+        assert json.loads(auth_manager.token_file.read_text()) == result["tokens"]
+
         # Verify services were called
         auth_manager.auth_service.authenticate_user.assert_called_once_with(
             "EMP001", "password123"
@@ -137,9 +140,7 @@ class TestAuthenticationManager:
         user = auth_manager.get_current_user()
         assert user == sample_employee_data
 
-    def test_get_current_user_from_token(
-        self, auth_manager, sample_employee_data, sample_tokens
-    ):
+    def test_get_current_user_from_token(self, auth_manager, sample_tokens):
         """Test getting current user from stored tokens"""
         # Mock token loading
         auth_manager._load_tokens = MagicMock(return_value=sample_tokens)
@@ -215,47 +216,52 @@ class TestAuthenticationManager:
         result = auth_manager.require_authentication()
         assert result is False
 
-    @patch("services.auth_manager.Session")
+    @pytest.fixture
+    def patched_session_and_perm(self):
+        """Patch the DB session and the permission check used by require_permission"""
+        with patch("services.auth_manager.Session") as mock_session_class, patch(
+            "services.auth_manager.has_permission"
+        ) as mock_has_permission:
+            yield mock_session_class.return_value, mock_has_permission
+
     def test_require_permission_success(
-        self, mock_session_class, auth_manager, sample_employee_data
+        self, patched_session_and_perm, auth_manager, sample_employee_data
     ):
         """Test successful permission check using require_permission"""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
+        mock_session, mock_has_permission = patched_session_and_perm
 
         mock_employee = MagicMock()
         mock_employee.id = 1
         mock_employee.role = "admin"
-        mock_session.query.return_value.get.return_value = mock_employee
+        mock_session.configure_mock(**{EMPLOYEE_QUERY_RESULT: mock_employee})
 
         # Mock permission check
-        with patch("services.auth_manager.has_permission", return_value=True):
-            auth_manager.current_user = sample_employee_data
+        mock_has_permission.return_value = True
+        auth_manager.current_user = sample_employee_data
 
-            result = auth_manager.require_permission(Permission.CREATE_CUSTOMER)
-            assert result is True
+        result = auth_manager.require_permission(Permission.CREATE_CUSTOMER)
+        assert result is True
+        mock_has_permission.assert_called_once_with(
+            mock_employee, Permission.CREATE_CUSTOMER
+        )
 
-    @patch("services.auth_manager.Session")
     def test_require_permission_denied(
-        self, mock_session_class, auth_manager, sample_employee_data
+        self, patched_session_and_perm, auth_manager, sample_employee_data
     ):
         """Test permission denied using require_permission"""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
+        mock_session, mock_has_permission = patched_session_and_perm
 
         mock_employee = MagicMock()
         mock_employee.id = 1
         mock_employee.role = "sales"
-        mock_session.query.return_value.get.return_value = mock_employee
+        mock_session.configure_mock(**{EMPLOYEE_QUERY_RESULT: mock_employee})
 
         # Mock permission check
-        with patch("services.auth_manager.has_permission", return_value=False):
-            auth_manager.current_user = sample_employee_data
+        mock_has_permission.return_value = False
+        auth_manager.current_user = sample_employee_data
 
-            result = auth_manager.require_permission(Permission.DELETE_CUSTOMER)
-            assert result is False
+        result = auth_manager.require_permission(Permission.DELETE_CUSTOMER)
+        assert result is False
 
     def test_get_session_info(self, auth_manager, sample_employee_data, sample_tokens):
         """Test getting session info"""
@@ -324,7 +330,10 @@ class TestAuthenticationManager:
         # After logout, current user should be None
         assert auth_manager.current_user is None
 
-    def test_token_file_permissions(self, auth_manager):
+    def test_token_file_permissions(self):
         """Test that token file path is in user directory"""
+        # Fresh manager: the fixture redirects the token file
+        auth_manager = AuthenticationManager()
+
         assert auth_manager.token_file.parent == Path.home()
         assert auth_manager.token_file.name == ".epic_events_tokens"
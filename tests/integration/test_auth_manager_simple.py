@@ -4,6 +4,7 @@ Tests core session management functionality
 """
 
 import pytest
+from datetime import datetime, timedelta, UTC
 from unittest.mock import MagicMock
 from pathlib import Path
 
@@ -14,27 +15,20 @@ class TestAuthenticationManagerSimple:
     """Simplified test suite for Authentication Manager"""
 
     @pytest.fixture
-    def auth_manager(self):
-        """Create authentication manager instance"""
+    def auth_manager(self, monkeypatch):
+        """
+        Create authentication manager instance
+        Its auth and JWT services are mocks, no real service is built
+        """
+        monkeypatch.setattr("services.auth_manager.AuthService", MagicMock)
+        monkeypatch.setattr("services.auth_manager.JWTService", MagicMock)
         return AuthenticationManager()
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """Sample employee data"""
-        return {
-            "id": 1,
-            "employee_number": "EMP001",
-            "name": "Test User",
-            "email": "test@example.com",
-            "role": "admin",
-            "role_id": 4,
-        }
-
     def test_initialization(self, auth_manager):
         """Test proper initialization"""
         assert auth_manager.current_user is None
-        assert auth_manager.auth_service is not None
-        assert auth_manager.jwt_service is not None
+        assert isinstance(auth_manager.auth_service, MagicMock)
+        assert isinstance(auth_manager.jwt_service, MagicMock)
         assert auth_manager.token_file.name == ".epic_events_tokens"
         assert auth_manager.token_file.parent == Path.home()
 
@@ -45,12 +39,12 @@ class TestAuthenticationManagerSimple:
             return_value=(True, sample_employee_data, "Login successful")
         )
 
-        # Mock JWT token creation
-        auth_manager.jwt_service.create_access_token = MagicMock(
-            return_value="access_token"
-        )
-        auth_manager.jwt_service.create_refresh_token = MagicMock(
-            return_value="refresh_token"
+        # JWT service is already a mock, only its tokens are set
+        auth_manager.jwt_service.configure_mock(
+            **{
+                "create_access_token.return_value": "access_token",
+                "create_refresh_token.return_value": "refresh_token",
+            }
         )
 
         # Mock token saving (to avoid file I/O)
@@ -155,12 +149,16 @@ class TestAuthenticationManagerSimple:
             "created_at": "2025-10-16T10:00:00",
         }
         auth_manager._load_tokens = MagicMock(return_value=mock_tokens)
+        expires_at = datetime.now(UTC) + timedelta(minutes=30)
+        auth_manager.jwt_service.verify_token.return_value = {
+            "exp": expires_at.timestamp()
+        }
 
         session_info = auth_manager.get_session_info()
 
         # Should return session info when user is logged in
-        if session_info:  # Method might return None in some cases
-            assert "user" in session_info or session_info is not None
+        assert session_info["user"] == sample_employee_data
+        assert session_info["logged_in_at"] == "2025-10-16T10:00:00"
 
     def test_session_info_no_user(self, auth_manager):
         """Test getting session info when not logged in"""
@@ -6,7 +6,8 @@ Migré vers SQLite in-memory pour des performances optimales
 
 import pytest
 
-from models import Employee, Role
+from models import Employee
+import services.auth
 from services.auth import AuthService
 
 
@@ -16,44 +17,12 @@ def auth_session(test_db):
     return test_db
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_service():
     """Create AuthService instance"""
     return AuthService()
 
 
-@pytest.fixture
-def test_roles(auth_session):
-    """Get test roles - returns fresh objects attached to current session"""
-    roles_data = {}
-    roles = auth_session.query(Role).all()
-
-    # Store role IDs instead of objects to avoid DetachedInstanceError
-    for role in roles:
-        roles_data[role.name] = {
-            "id": role.id,
-            "name": role.name,
-            "description": role.description,
-        }
-
-    # Return a dict-like object that allows accessing both id and full role
-    class RoleHelper:
-
-        def __init__(self, session, roles_data):
-            self.session = session
-            self.roles_data = roles_data
-
-        def __getitem__(self, key):
-            if key not in self.roles_data:
-                raise KeyError(f"Role '{key}' not found")
-
-            # Return fresh role object from current session
-            role_id = self.roles_data[key]["id"]
-            return self.session.query(Role).filter(Role.id == role_id).first()
-
-    return RoleHelper(auth_session, roles_data)
-
-
 class TestAuthService:
     """Test AuthService functionality"""
 
@@ -69,6 +38,14 @@ class TestAuthService:
         assert len(hashed) > 50  # Argon2 hashes are long
         assert hashed.startswith("$argon2")  # Argon2 format
 
+    def test_default_hashing_parameters(self, auth_service):
+        """Test that Argon2 keeps its production cost outside tests"""
+        # Tests run with the cheapest Argon2 parameters (see tests/conftest.py)
+        assert auth_service.ph.memory_cost == 8
+
+        assert services.auth.HASH_TIME_COST == 3
+        assert services.auth.HASH_MEMORY_COST == 65536
+
     def test_password_verification(self, auth_service):
         """Test password verification"""
         password = "TestPassword123!"
@@ -83,44 +60,39 @@ class TestAuthService:
         assert not auth_service.verify_password(hashed, wrong_password)
 
     def test_create_employee_with_password(
-        self, auth_service, test_roles, auth_session
+        self, auth_service, base_role_ids, auth_session
     ):
         """Test creating employee with password"""
         employee_data = auth_service.create_employee_with_password(
             name="Test User",
             email="test@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password="SecurePass123!",
         )
 
         # Check returned data
         assert employee_data["name"] == "Test User"
         assert employee_data["email"] == "test@example.com"
-        assert employee_data["role_id"] == test_roles["sales"].id
+        assert employee_data["role_id"] == base_role_ids["sales"]
         assert employee_data["employee_number"].startswith("EMP")
 
         # Verify employee was created in database
-        employee = (
-            auth_session.query(Employee)
-            .filter_by(employee_number=employee_data["employee_number"])
-            .first()
-        )
+        employee = auth_session.get(Employee, employee_data["id"])
 
         assert employee is not None
         assert employee.password_hash is not None
         assert employee.password_hash != "SecurePass123!"  # Should be hashed
 
-    def test_employee_number_generation(self, auth_service, test_roles, auth_session):
+    def test_employee_number_generation(
+        self, auth_service, base_role_ids, auth_session
+    ):
         """Test auto-generation of employee numbers"""
-        # Clear existing employees first
-        auth_session.query(Employee).delete()
-        auth_session.commit()
-
+        # test_db rolls back every test, so no employee exists yet
         # Create first employee
         emp1 = auth_service.create_employee_with_password(
             name="Employee 1",
             email="emp1@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password="TestPassword123!",
         )
 
@@ -128,7 +100,7 @@ class TestAuthService:
         emp2 = auth_service.create_employee_with_password(
             name="Employee 2",
             email="emp2@example.com",
-            role_id=test_roles["support"].id,
+            role_id=base_role_ids["support"],
             password="TestPassword123!",
         )
 
@@ -136,7 +108,7 @@ class TestAuthService:
         assert emp1["employee_number"] == "EMP001"
         assert emp2["employee_number"] == "EMP002"
 
-    def test_authenticate_user_success(self, auth_service, test_roles, auth_session):
+    def test_authenticate_user_success(self, auth_service, base_role_ids, auth_session):
         """Test successful user authentication"""
         password = "AuthTestPassword123!"
 
@@ -144,7 +116,7 @@ class TestAuthService:
         employee_data = auth_service.create_employee_with_password(
             name="Auth Test User",
             email="authtest@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password=password,
         )
 
@@ -157,22 +129,20 @@ class TestAuthService:
         assert employee is not None
 
         # Check employee data through fresh session to avoid detached instance
-        fresh_employee = (
-            auth_session.query(Employee)
-            .filter_by(employee_number=employee_data["employee_number"])
-            .first()
-        )
+        fresh_employee = auth_session.get(Employee, employee_data["id"])
         assert fresh_employee.name == "Auth Test User"
 
         assert "successful" in message.lower()
 
-    def test_authenticate_user_wrong_password(self, auth_service, test_roles):
+    def test_authenticate_user_wrong_password(
+        self, auth_service, base_role_ids, auth_session
+    ):
         """Test authentication with wrong password"""
         # Create test user
         employee_data = auth_service.create_employee_with_password(
             name="Wrong Pass Test",
             email="wrongpass@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password="CorrectPassword123!",
         )
 
@@ -188,8 +158,9 @@ class TestAuthService:
             or "attempts remaining" in message.lower()
         )
 
-    def test_authenticate_nonexistent_user(self, auth_service):
+    def test_authenticate_nonexistent_user(self, auth_service, auth_session):
         """Test authentication with non-existent user"""
+        # auth_session makes AuthService query the shared test session
         success, employee, message = auth_service.authenticate_user(
             "EMP999", "AnyPasswordTest123!"
         )
@@ -198,26 +169,26 @@ class TestAuthService:
         assert employee is None
         assert "invalid employee number" in message.lower()
 
-    def test_login_attempts_locking(self, auth_service, test_roles):
+    def test_login_attempts_locking(self, auth_service, base_role_ids, auth_session):
         """Test that account locks after failed attempts"""
         # Create test user
         employee_data = auth_service.create_employee_with_password(
             name="Lock Test User",
             email="locktest@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password="CorrectPassword123!",
         )
 
         employee_number = employee_data["employee_number"]
 
-        # Make 5 failed attempts (should lock on 5th)
-        for i in range(5):
-            success, employee, message = auth_service.authenticate_user(
-                employee_number, "WrongPasswordTest123!"
-            )
-            assert success is False
+        # Record the first 4 failed attempts directly, the threshold
+        # is what is under test here, not the password verification
+        auth_session.query(Employee).filter_by(
+            employee_number=employee_number
+        ).update({"failed_login_attempts": auth_service.max_attempts - 1})
+        auth_session.commit()
 
-        # 6th attempt should show account locked
+        # 5th failed attempt should lock the account
         success, employee, message = auth_service.authenticate_user(
             employee_number, "WrongPasswordTest123!"
         )
@@ -234,14 +205,14 @@ class TestAuthService:
         assert "locked" in message.lower()
 
     def test_successful_login_resets_attempts(
-        self, auth_service, test_roles, auth_session
+        self, auth_service, base_role_ids, auth_session
     ):
         """Test that successful login resets failed attempts"""
         # Create test user
         employee_data = auth_service.create_employee_with_password(
             name="Reset Test User",
             email="resettest@example.com",
-            role_id=test_roles["sales"].id,
+            role_id=base_role_ids["sales"],
             password="ResetPassword123!",
         )
 
@@ -259,11 +230,7 @@ class TestAuthService:
         assert success is True
 
         # Check that failed attempts were reset
-        employee = (
-            auth_session.query(Employee)
-            .filter_by(employee_number=employee_number)
-            .first()
-        )
+        employee = auth_session.get(Employee, employee_data["id"])
 
         assert employee.failed_login_attempts == 0
         assert employee.last_login is not None
@@ -275,8 +242,5 @@ class TestEmployeeModel:
     def test_employee_generate_number(self, auth_session):
         """Test static employee number generation"""
         # Should start with EMP001 when no employees exist
-        auth_session.query(Employee).delete()
-        auth_session.commit()
-
         number = Employee.generate_employee_number(auth_session)
         assert number == "EMP001"
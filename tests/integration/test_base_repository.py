@@ -1,9 +1,10 @@
 """
 Tests for BaseRepository
-Demonstrates how to test the repository pattern with PostgreSQL
+Demonstrates how to test the repository pattern against the test database
 """
 
 import pytest
+
 from models import Customer
 from repositories.customer import CustomerRepository
 
@@ -14,7 +15,7 @@ def customer_repo(test_db):
     return CustomerRepository(test_db)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_customer_data():
     """Sample customer data for testing"""
     return {
@@ -25,6 +26,45 @@ def sample_customer_data():
     }
 
 
+@pytest.fixture(scope="module")
+def make_customer(sample_customer_data):
+    """Build customer data from the sample with some fields overridden"""
+
+    def _make(**overrides):
+        data = sample_customer_data.copy()
+        data.update(overrides)
+        return data
+
+    return _make
+
+
+# Companies of the customers in populated_repo, in insertion order
+POPULATED_COMPANIES = ["ACME Corp"] * 3 + ["Other Corp"] * 2
+
+
+@pytest.fixture(scope="class")
+def populated_repo(outer_transaction, make_customer):
+    """
+    Customer repository over 5 customers inserted once for the class
+    Read-only tests share it, everything is rolled back afterwards
+    Holds the outer transaction: tests using it must not request test_db
+    """
+    with outer_transaction() as session:
+        session.add_all(
+            Customer(
+                **make_customer(
+                    email=f"user{i}@example.com",
+                    full_name=f"User {i}",
+                    company_name=company,
+                )
+            )
+            for i, company in enumerate(POPULATED_COMPANIES)
+        )
+        session.flush()
+
+        yield CustomerRepository(session)
+
+
 # Tests for BaseRepository methods
 class TestBaseRepository:
     """Test suite for BaseRepository CRUD operations"""
@@ -57,43 +97,6 @@ class TestBaseRepository:
         results = customer_repo.get_all()
         assert len(results) == 0
 
-    def test_get_all_with_data(self, customer_repo, sample_customer_data):
-        """Test getting all entities"""
-        customer_repo.create(sample_customer_data)
-        customer_repo.create(
-            {
-                **sample_customer_data,
-                "email": "jane@example.com",
-                "full_name": "Jane Doe",
-            }
-        )
-
-        results = customer_repo.get_all()
-        assert len(results) == 2
-
-    def test_get_all_with_pagination(self, customer_repo, sample_customer_data):
-        """Test pagination with limit and offset"""
-        # Create 5 customers
-        for i in range(5):
-            customer_repo.create(
-                {
-                    **sample_customer_data,
-                    "email": f"user{i}@example.com",
-                    "full_name": f"User {i}",
-                }
-            )
-
-        # Get first 2
-        page1 = customer_repo.get_all(limit=2, offset=0)
-        assert len(page1) == 2
-
-        # Get next 2
-        page2 = customer_repo.get_all(limit=2, offset=2)
-        assert len(page2) == 2
-
-        # Verify they are different
-        assert page1[0].id != page2[0].id
-
     def test_update_entity(self, customer_repo, sample_customer_data):
         """Test updating an entity"""
         customer = customer_repo.create(sample_customer_data)
@@ -125,23 +128,6 @@ class TestBaseRepository:
         result = customer_repo.delete(99999)
         assert result is False
 
-    def test_filter_by(self, customer_repo, sample_customer_data):
-        """Test filtering by specific criteria"""
-        customer_repo.create(sample_customer_data)
-        customer_repo.create(
-            {
-                **sample_customer_data,
-                "email": "jane@example.com",
-                "full_name": "Jane Doe",
-                "company_name": "Other Corp",
-            }
-        )
-
-        # Filter by company
-        results = customer_repo.filter_by(company_name="ACME Corp")
-        assert len(results) == 1
-        assert results[0].company_name == "ACME Corp"
-
     def test_exists(self, customer_repo, sample_customer_data):
         """Test checking if entity exists"""
         customer = customer_repo.create(sample_customer_data)
@@ -150,24 +136,59 @@ class TestBaseRepository:
         assert customer_repo.exists(99999) is False
 
 
+class TestBaseRepositoryReads:
+    """Read-only BaseRepository queries against one populated table"""
+
+    @pytest.mark.parametrize(
+        "limit, offset, expected",
+        [(None, 0, 5), (2, 0, 2), (2, 2, 2), (2, 4, 1)],
+    )
+    def test_get_all(self, populated_repo, limit, offset, expected):
+        """Test getting all entities with limit and offset"""
+        results = populated_repo.get_all(limit=limit, offset=offset)
+        assert len(results) == expected
+
+    def test_get_all_pages_are_different(self, populated_repo):
+        """Test that consecutive pages do not overlap"""
+        page1 = populated_repo.get_all(limit=2, offset=0)
+        page2 = populated_repo.get_all(limit=2, offset=2)
+
+        assert not {c.id for c in page1} & {c.id for c in page2}
+
+    @pytest.mark.parametrize("company", ["ACME Corp", "Other Corp", "Unknown Corp"])
+    def test_filter_by(self, populated_repo, company):
+        """Test filtering by specific criteria"""
+        results = populated_repo.filter_by(company_name=company)
+
+        assert len(results) == POPULATED_COMPANIES.count(company)
+        assert all(c.company_name == company for c in results)
+
+
+class FakeCustomerRepo:
+    """Hand-rolled stand-in for CustomerRepository that records its calls"""
+
+    def __init__(self):
+        self.create_calls = []
+
+    def create(self, data):
+        self.create_calls.append(data)
+        return Customer(id=1, full_name="John Doe", email="john@example.com")
+
+
 # Example of testing with mocks
 class TestWithMocks:
     """Examples of testing services with mocked repositories"""
 
     def test_service_with_mock_repository(self):
-        """Example: Testing a service with a mocked repository"""
-        from unittest.mock import MagicMock
-
-        # Create a mock repository
-        mock_repo = MagicMock(spec=CustomerRepository)
-        mock_customer = Customer(id=1, full_name="John Doe", email="john@example.com")
-        mock_repo.create.return_value = mock_customer
+        """Example: Testing a service with a fake repository"""
+        # Create a fake repository
+        repo = FakeCustomerRepo()
 
-        # Use the mock in your service
-        result = mock_repo.create({"full_name": "John Doe"})
+        # Use the fake in your service
+        result = repo.create({"full_name": "John Doe"})
 
         assert result.id == 1
-        mock_repo.create.assert_called_once()
+        assert len(repo.create_calls) == 1
 
 
 if __name__ == "__main__":
@@ -1,58 +1,82 @@
 """
 Tests for CASCADE behaviors in database relationships
 Tests that foreign key constraints work properly with CASCADE DELETE and SET NULL
-Tests avec PostgreSQL pour cohérence production
+Tests avec SQLite en mémoire par défaut, PostgreSQL via DB_TEST_BACKEND=postgresql
 """
 
+import logging
+from collections import namedtuple
 from datetime import datetime
 
 import pytest
+from sqlalchemy import func, select
 
-from models import Role
+from models import Contract, Customer, Employee, Event
 from repositories import (
     ContractRepository,
     CustomerRepository,
     EmployeeRepository,
-    EventRepository,
 )
-from services.auth import AuthService
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture
-def cascade_session(test_db):
-    """Session pour tests de cascade - utilise les rôles de conftest.py"""
-    yield test_db
+# Date fixe des contrats et événements, évite des données dépendantes de l'heure
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
 
+TableCounts = namedtuple("TableCounts", ["customers", "contracts", "events"])
 
-@pytest.fixture
-def roles_setup(cascade_session):
-    """Récupérer les rôles créés dans conftest.py - évite DetachedInstanceError"""
-    roles_data = {}
-    for role_name in ["sales", "support", "management", "admin"]:
-        role = cascade_session.query(Role).filter_by(name=role_name).first()
-        if role:
-            roles_data[role_name] = {
-                "id": role.id,
-                "name": role.name,
-                "description": role.description,
-            }
 
-    # Return a dict-like object that allows accessing both id and full role
-    class RoleHelper:
+def table_counts(session):
+    """Nombre de clients, contrats et événements, en une seule requête"""
+    row = session.execute(
+        select(
+            *(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in (Customer, Contract, Event)
+            )
+        )
+    ).one()
+    return TableCounts(*row)
 
-        def __init__(self, session, roles_data):
-            self.session = session
-            self.roles_data = roles_data
 
-        def __getitem__(self, key):
-            if key not in self.roles_data:
-                raise KeyError(f"Role '{key}' not found")
+GraphContactIds = namedtuple(
+    "GraphContactIds", ["customer_sales", "contract_sales", "event_support"]
+)
 
-            # Return fresh role object from current session
-            role_id = self.roles_data[key]["id"]
-            return self.session.query(Role).filter(Role.id == role_id).first()
 
-    return RoleHelper(cascade_session, roles_data)
+def graph_contact_ids(session, customer_id):
+    """Employés liés au client, à son contrat et à son événement, en une requête"""
+    row = session.execute(
+        select(
+            Customer.sales_contact_id,
+            Contract.sales_contact_id,
+            Event.support_contact_id,
+        )
+        .join(Contract, Contract.customer_id == Customer.id)
+        .join(Event, Event.contract_id == Contract.id)
+        .where(Customer.id == customer_id)
+    ).one()
+    return GraphContactIds(*row)
+
+
+def create_graph(session, customer_data, contract_data, event_data):
+    """
+    Client, contrat et événement liés, insérés en un seul commit
+    Le commit expire les objets : les suppressions ne voient pas
+    les collections chargées et laissent la base appliquer ses règles
+    """
+    customer = Customer(**customer_data)
+    contract = Contract(customer=customer, **contract_data)
+    event = Event(customer=customer, contract=contract, **event_data)
+    session.add_all([customer, contract, event])
+    session.commit()
+    return customer, contract, event
+
+
+@pytest.fixture
+def cascade_session(test_db):
+    """Session pour tests de cascade - utilise les rôles de conftest.py"""
+    yield test_db
 
 
 @pytest.fixture
@@ -68,18 +92,25 @@ def employee_repo(cascade_session):
 
 
 @pytest.fixture
-def auth_service():
-    """Create AuthService for employee creation"""
-    return AuthService()
-
-
-def create_test_employee_with_auth(
-    auth_service, name, email, role_id, password="TestPassword123!"
-):
-    """Helper to create employee with authentication"""
-    return auth_service.create_employee_with_password(
-        name=name, email=email, role_id=role_id, password=password
+def employees(cascade_session, base_role_ids, password_hash):
+    """Commercial et support insérés en un seul flush, sans re-hacher"""
+    sales = Employee(
+        employee_number="EMP001",
+        name="Sales Person",
+        email="sales@test.com",
+        role_id=base_role_ids["sales"],
+        password_hash=password_hash,
     )
+    support = Employee(
+        employee_number="EMP002",
+        name="Support Person",
+        email="support@test.com",
+        role_id=base_role_ids["support"],
+        password_hash=password_hash,
+    )
+    cascade_session.add_all([sales, support])
+    cascade_session.flush()
+    return {"sales": sales, "support": support}
 
 
 @pytest.fixture
@@ -88,277 +119,185 @@ def contract_repo(cascade_session):
     return ContractRepository(cascade_session)
 
 
-@pytest.fixture
-def event_repo(cascade_session):
-    """Event repository instance"""
-    return EventRepository(cascade_session)
-
-
 def test_cascade_delete_customer_deletes_contracts_and_events(
-    cascade_session,
-    customer_repo,
-    employee_repo,
-    contract_repo,
-    event_repo,
-    roles_setup,
-    auth_service,
+    cascade_session, customer_repo, employees
 ):
     """
     Test that deleting a Customer also deletes its Contracts and Events
-    thanks to cascade='all, delete-orphan' on relationships
+    through the database's ON DELETE CASCADE (relationships use passive_deletes)
     """
-    print("\n=== Test CASCADE: Deleting Customer → Contract + Event ===")
-
-    # Create employees with authentication
-    sales_data = create_test_employee_with_auth(
-        auth_service, "Sales Person", "sales@test.com", roles_setup["sales"].id
-    )
-    support_data = create_test_employee_with_auth(
-        auth_service, "Support Person", "support@test.com", roles_setup["support"].id
-    )
+    logger.debug("=== Test CASCADE: Deleting Customer → Contract + Event ===")
 
-    # Get employee objects from database
-    sales = employee_repo.get_by_id(sales_data["id"])
-    support = employee_repo.get_by_id(support_data["id"])
-
-    # Create a customer
-    customer = customer_repo.create(
-        {"full_name": "John Doe", "email": "john@test.com", "phone": "0123456789"}
-    )
+    sales = employees["sales"]
+    support = employees["support"]
 
-    # Create a contract linked to the customer
-    contract = contract_repo.create(
+    # Create a customer with its contract and event
+    customer, _, _ = create_graph(
+        cascade_session,
+        {"full_name": "John Doe", "email": "john@test.com", "phone": "0123456789"},
         {
-            "customer_id": customer.id,
             "sales_contact_id": sales.id,
             "total_amount": 5000.0,
             "remaining_amount": 2500.0,
-            "date_created": datetime.now(),
+            "date_created": FIXED_TIMESTAMP,
             "signed": False,
-        }
-    )
-
-    # Create an event linked to the contract and the customer
-    event_repo.create(
+        },
         {
-            "contract_id": contract.id,
-            "customer_id": customer.id,
             "support_contact_id": support.id,
             "name": "Wedding",
-            "date_start": datetime.now(),
-            "date_end": datetime.now(),
+            "date_start": FIXED_TIMESTAMP,
+            "date_end": FIXED_TIMESTAMP,
             "location": "Paris",
             "attendees": 100,
             "notes": "Test event",
-        }
+        },
     )
 
     # Check that everything exists
-    assert len(customer_repo.get_all()) == 1
-    assert len(contract_repo.get_all()) == 1
-    assert len(event_repo.get_all()) == 1
-    print("Before deletion: 1 Customer, 1 Contract, 1 Event")
+    assert table_counts(cascade_session) == (1, 1, 1)
+    logger.debug("Before deletion: 1 Customer, 1 Contract, 1 Event")
 
     # Delete the customer
     customer_repo.delete(customer.id)
-    cascade_session.commit()
 
     # Check that the customer, contract AND event have been deleted (CASCADE)
-    assert len(customer_repo.get_all()) == 0
-    assert len(contract_repo.get_all()) == 0
-    assert len(event_repo.get_all()) == 0
-    print("After deletion Customer: 0 Customer, 0 Contract, 0 Event (CASCADE OK)")
+    assert table_counts(cascade_session) == (0, 0, 0)
+    logger.debug(
+        "After deletion Customer: 0 Customer, 0 Contract, 0 Event (CASCADE OK)"
+    )
 
 
 def test_cascade_delete_contract_deletes_events(
-    cascade_session,
-    customer_repo,
-    employee_repo,
-    contract_repo,
-    event_repo,
-    roles_setup,
-    auth_service,
+    cascade_session, contract_repo, employees
 ):
     """
     Test that deleting a Contract also deletes its Events
-    thanks to cascade='all, delete-orphan' on contract.events relationship
+    through the database's ON DELETE CASCADE on events.contract_id
     """
-    print("\n=== Test CASCADE: Deleting Contract → Event ===")
+    logger.debug("=== Test CASCADE: Deleting Contract → Event ===")
 
-    # Create employees with authentication
-    sales_data = create_test_employee_with_auth(
-        auth_service, "Sales Person", "sales2@test.com", roles_setup["sales"].id
-    )
-    support_data = create_test_employee_with_auth(
-        auth_service, "Support Person", "support2@test.com", roles_setup["support"].id
-    )
+    sales = employees["sales"]
+    support = employees["support"]
 
-    # Get employee objects from database
-    sales = employee_repo.get_by_id(sales_data["id"])
-    support = employee_repo.get_by_id(support_data["id"])
-    customer = customer_repo.create(
-        {"full_name": "Jane Doe", "email": "jane@test.com", "phone": "0123456789"}
-    )
-
-    # Create contract
-    contract = contract_repo.create(
+    # Create a customer with its contract and event
+    _, contract, _ = create_graph(
+        cascade_session,
+        {"full_name": "Jane Doe", "email": "jane@test.com", "phone": "0123456789"},
         {
-            "customer_id": customer.id,
             "sales_contact_id": sales.id,
             "total_amount": 3000.0,
             "remaining_amount": 1500.0,
-            "date_created": datetime.now(),
+            "date_created": FIXED_TIMESTAMP,
             "signed": False,
-        }
-    )
-
-    # Create event
-    event_repo.create(
+        },
         {
-            "contract_id": contract.id,
-            "customer_id": customer.id,
             "support_contact_id": support.id,
             "name": "Conference",
-            "date_start": datetime.now(),
-            "date_end": datetime.now(),
+            "date_start": FIXED_TIMESTAMP,
+            "date_end": FIXED_TIMESTAMP,
             "location": "Lyon",
             "attendees": 50,
             "notes": "Test conference",
-        }
+        },
     )
 
     # Check
-    assert len(contract_repo.get_all()) == 1
-    assert len(event_repo.get_all()) == 1
-    print("Before deletion: 1 Contract, 1 Event")
+    counts = table_counts(cascade_session)
+    assert (counts.contracts, counts.events) == (1, 1)
+    logger.debug("Before deletion: 1 Contract, 1 Event")
 
     # Delete the contract
     contract_repo.delete(contract.id)
-    cascade_session.commit()
 
     # Check that the event has also been deleted (CASCADE)
-    assert len(contract_repo.get_all()) == 0
-    assert len(event_repo.get_all()) == 0
-    print("After deletion Contract: 0 Contract, 0 Event (CASCADE OK)")
+    counts = table_counts(cascade_session)
+    assert (counts.contracts, counts.events) == (0, 0)
+    logger.debug("After deletion Contract: 0 Contract, 0 Event (CASCADE OK)")
 
 
 def test_delete_employee_sets_null_on_foreign_keys(
-    cascade_session,
-    customer_repo,
-    employee_repo,
-    contract_repo,
-    event_repo,
-    roles_setup,
-    auth_service,
+    cascade_session, employee_repo, employees
 ):
     """
     Test that deleting an Employee sets to NULL the foreign keys
-    in Customer, Contract, Event thanks to ondelete='SET NULL'
+    in Customer, Contract, Event through the database's ON DELETE SET NULL
     """
-    print("\n=== Test CASCADE: Deleting Employee → SET NULL ===")
+    logger.debug("=== Test CASCADE: Deleting Employee → SET NULL ===")
 
-    # Create employees with authentication
-    sales_data = create_test_employee_with_auth(
-        auth_service, "Sales Person", "sales3@test.com", roles_setup["sales"].id
-    )
-    support_data = create_test_employee_with_auth(
-        auth_service, "Support Person", "support3@test.com", roles_setup["support"].id
-    )
-
-    # Get employee objects from database
-    sales = employee_repo.get_by_id(sales_data["id"])
-    support = employee_repo.get_by_id(support_data["id"])
+    sales = employees["sales"]
+    support = employees["support"]
 
-    # Create customer linked to sales
-    customer = customer_repo.create(
+    # Create a customer with its contract and event
+    customer, _, _ = create_graph(
+        cascade_session,
         {
             "full_name": "Bob Smith",
             "email": "bob@test.com",
             "phone": "0123456789",
             "sales_contact_id": sales.id,
-        }
-    )
-
-    # Create contract
-    contract = contract_repo.create(
+        },
         {
-            "customer_id": customer.id,
             "sales_contact_id": sales.id,
             "total_amount": 4000.0,
             "remaining_amount": 2000.0,
-            "date_created": datetime.now(),
+            "date_created": FIXED_TIMESTAMP,
             "signed": False,
-        }
-    )
-
-    # Create event
-    event = event_repo.create(
+        },
         {
-            "contract_id": contract.id,
-            "customer_id": customer.id,
             "support_contact_id": support.id,
             "name": "Gala",
-            "date_start": datetime.now(),
-            "date_end": datetime.now(),
+            "date_start": FIXED_TIMESTAMP,
+            "date_end": FIXED_TIMESTAMP,
             "location": "Nice",
             "attendees": 200,
             "notes": "Test gala",
-        }
+        },
     )
 
     # Check foreign keys before deletion
-    cascade_session.refresh(customer)
-    cascade_session.refresh(event)
-    print(
-        f"Before: Customer.sales_contact_id = {customer.sales_contact_id}, "
-        f"Event.support_contact_id = {event.support_contact_id}"
+    contact_ids = graph_contact_ids(cascade_session, customer.id)
+    assert contact_ids == (sales.id, sales.id, support.id)
+    logger.debug(
+        "Before: Customer.sales_contact_id = %s, Event.support_contact_id = %s",
+        contact_ids.customer_sales,
+        contact_ids.event_support,
     )
 
     # Delete the sales employee
     employee_repo.delete(sales.id)
-    cascade_session.commit()
 
     # Check that entities still exist but with FK set to NULL
-    assert len(customer_repo.get_all()) == 1, "Customer should still exist"
-    assert len(contract_repo.get_all()) == 1, "Contract should still exist"
-    assert len(event_repo.get_all()) == 1, "Event should still exist"
+    counts = table_counts(cascade_session)
+    assert counts == (1, 1, 1), "Customer, Contract and Event should still exist"
 
-    # Refresh to get updated values
-    cascade_session.refresh(customer)
-    cascade_session.refresh(contract)
-
-    assert customer.sales_contact_id is None, "Customer.sales_contact_id should be NULL"
-    assert contract.sales_contact_id is None, "Contract.sales_contact_id should be NULL"
-    print(
+    # Customer and Contract lose their sales contact, the event keeps its support
+    contact_ids = graph_contact_ids(cascade_session, customer.id)
+    assert contact_ids == (None, None, support.id), "Sales FKs should be NULL"
+    logger.debug(
         "After deletion Sales:"
         "Customer and Contract exist with FK = NULL (SET NULL OK)"
     )
 
     # Delete the support employee
     employee_repo.delete(support.id)
-    cascade_session.commit()
 
     # Check event still exists with NULL FK
-    assert len(event_repo.get_all()) == 1, "Event should still exist"
-    cascade_session.refresh(event)
-    assert event.support_contact_id is None, "Event.support_contact_id should be NULL"
-    print("After deletion Support: Event exists with FK = NULL (SET NULL OK)")
+    assert table_counts(cascade_session).events == 1, "Event should still exist"
+    contact_ids = graph_contact_ids(cascade_session, customer.id)
+    assert contact_ids.event_support is None, "Event.support_contact_id should be NULL"
+    logger.debug("After deletion Support: Event exists with FK = NULL (SET NULL OK)")
 
 
 def test_employee_deletion_preserves_related_entities(
-    cascade_session, customer_repo, employee_repo, roles_setup, auth_service
+    cascade_session, customer_repo, employee_repo, employees
 ):
     """
     Test that deleting an Employee does not delete related Customers,
     only sets the foreign key to NULL
     """
-    print("\n=== Test: Deleting Employee preserves related entities ===")
+    logger.debug("=== Test: Deleting Employee preserves related entities ===")
 
-    # Create employee with authentication
-    employee_data = create_test_employee_with_auth(
-        auth_service, "Sales Manager", "manager@test.com", roles_setup["sales"].id
-    )
-    employee = employee_repo.get_by_id(employee_data["id"])
+    employee = employees["sales"]
     customer = customer_repo.create(
         {
             "full_name": "Alice Wonder",
@@ -368,20 +307,19 @@ def test_employee_deletion_preserves_related_entities(
         }
     )
 
-    assert len(customer_repo.get_all()) == 1
+    assert table_counts(cascade_session).customers == 1
     assert customer.sales_contact_id == employee.id
-    print("Before deletion: 1 Employee, 1 Customer linked")
+    logger.debug("Before deletion: 1 Employee, 1 Customer linked")
 
     # Delete the employee
     employee_repo.delete(employee.id)
-    cascade_session.commit()
 
     # Check that the Customer still exists
-    assert len(employee_repo.get_all()) == 0, "Employee should be deleted"
-    assert len(customer_repo.get_all()) == 1, "Customer should still exist"
+    assert not employee_repo.exists(employee.id), "Employee should be deleted"
+    assert table_counts(cascade_session).customers == 1, "Customer should still exist"
 
     cascade_session.refresh(customer)
     assert customer.sales_contact_id is None, "Foreign key should be NULL"
-    print(
+    logger.debug(
         "After deletion Employee: Customer" " exists with FK = NULL (Correct behavior)"
     )
@@ -24,15 +24,15 @@ def coverage_session(test_db):
 @pytest.fixture
 def coverage_roles(coverage_session):
     """Retrieve roles created in conftest.py - avoids DetachedInstanceError"""
-    roles_data = {}
-    for role_name in ["sales", "support", "management", "admin"]:
-        role = coverage_session.query(Role).filter_by(name=role_name).first()
-        if role:
-            roles_data[role_name] = {
-                "id": role.id,
-                "name": role.name,
-                "description": role.description,
-            }
+    roles = (
+        coverage_session.query(Role)
+        .filter(Role.name.in_(["sales", "support", "management", "admin"]))
+        .all()
+    )
+    roles_data = {
+        role.name: {"id": role.id, "name": role.name, "description": role.description}
+        for role in roles
+    }
 
     # Return a dict-like object that allows accessing both id and full role
     class RoleHelper:
@@ -45,9 +45,10 @@ def coverage_roles(coverage_session):
             if key not in self.roles_data:
                 raise KeyError(f"Role '{key}' not found")
 
-            # Return fresh role object from current session
+            # Return role object from current session: the identity map
+            # serves repeated lookups, a closed session reloads it
             role_id = self.roles_data[key]["id"]
-            return self.session.query(Role).filter(Role.id == role_id).first()
+            return self.session.get(Role, role_id)
 
     return RoleHelper(coverage_session, roles_data)
 
@@ -76,7 +77,7 @@ def event_repo_coverage(coverage_session):
     return EventRepository(coverage_session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_service_coverage():
     """Service d'authentification pour tests"""
     return AuthService()
@@ -2,18 +2,32 @@
 Integration tests to finalize coverage to 80%
 """
 
+import importlib
+
 import pytest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
+CLI_MODULES = [
+    "cli.main",
+    "cli.commands.employee",
+    "cli.commands.customer",
+    "cli.commands.contract",
+    "cli.commands.event",
+    "cli.utils.auth",
+    "cli.utils.error_handling",
+]
 
-class TestCLIMainCoverage:
-    """Tests to improve cli.main (40% → 60%+)"""
 
-    def test_cli_main_import(self):
-        """Test import of the main CLI"""
-        from cli.main import cli
+@pytest.mark.parametrize("module_name", CLI_MODULES)
+def test_cli_module_importable(module_name):
+    """Test that every CLI module can be imported"""
+    module = importlib.import_module(module_name)
+
+    assert getattr(module, "__file__", None)
 
-        assert cli is not None
+
+class TestCLIMainCoverage:
+    """Tests to improve cli.main (40% → 60%+)"""
 
     def test_cli_groups_exist(self):
         """Test that CLI groups exist"""
@@ -45,39 +59,33 @@ class TestMainInitDbCoverage:
 class TestRepositoriesDeepCoverage:
     """Tests to boost repositories coverage"""
 
-    def test_customer_repository_basic_methods(self):
+    def test_customer_repository_basic_methods(self, empty_query_db):
         """Test basic methods of CustomerRepository"""
         from repositories.customer import CustomerRepository
 
-        mock_db = MagicMock()
-        repo = CustomerRepository(mock_db)
+        repo = CustomerRepository(empty_query_db)
 
-        # Test get_all avec résultat vide - need to mock order_by chain
-        mock_db.query.return_value.order_by.return_value.all.return_value = []
+        # Test get_all avec résultat vide
         result = repo.get_all()
         assert result == []
 
-    def test_contract_repository_filter_methods(self):
+    def test_contract_repository_filter_methods(self, empty_query_db):
         """Test filter methods of ContractRepository"""
         from repositories.contract import ContractRepository
 
-        mock_db = MagicMock()
-        repo = ContractRepository(mock_db)
+        repo = ContractRepository(empty_query_db)
 
-        # Test avec query simple - need to mock order_by chain
-        mock_db.query.return_value.order_by.return_value.all.return_value = []
+        # Test get_all avec résultat vide
         result = repo.get_all()
         assert result == []
 
-    def test_event_repository_filter_methods(self):
+    def test_event_repository_filter_methods(self, empty_query_db):
         """Test filter methods of EventRepository"""
         from repositories.event import EventRepository
 
-        mock_db = MagicMock()
-        repo = EventRepository(mock_db)
+        repo = EventRepository(empty_query_db)
 
-        # Test avec query simple - need to mock order_by chain  
-        mock_db.query.return_value.order_by.return_value.all.return_value = []
+        # Test get_all avec résultat vide
         result = repo.get_all()
         assert result == []
 
@@ -89,7 +97,7 @@ class TestServicesCoverageBoost:
         """Test extended initialization of ContractService"""
         from services.contract import ContractService
 
-        mock_repo = MagicMock()
+        mock_repo = SimpleNamespace()
         service = ContractService(mock_repo)
 
         # Test attributs de base
@@ -100,7 +108,7 @@ class TestServicesCoverageBoost:
         """Test extended initialization of EventService"""
         from services.event import EventService
 
-        mock_repo = MagicMock()
+        mock_repo = SimpleNamespace()
         service = EventService(mock_repo)
 
         # Test attributs de base
@@ -108,48 +116,14 @@ class TestServicesCoverageBoost:
         assert service.repository == mock_repo
 
 
-class TestCLICommandsBasic:
-    """Tests for basic CLI commands"""
-
-    def test_employee_commands_module(self):
-        """Test employee commands module"""
-        import cli.commands.employee
-
-        assert hasattr(cli.commands.employee, "__file__")
-
-    def test_customer_commands_module(self):
-        """Test customer commands module"""
-        import cli.commands.customer
-
-        assert hasattr(cli.commands.customer, "__file__")
-
-    def test_contract_commands_module(self):
-        """Test module contract commands"""
-        import cli.commands.contract
-
-        assert hasattr(cli.commands.contract, "__file__")
-
-    def test_event_commands_module(self):
-        """Test module event commands"""
-        import cli.commands.event
-
-        assert hasattr(cli.commands.event, "__file__")
-
-
 class TestCLIAuthExtended:
     """Tests behind CLI auth"""
 
-    def test_cli_auth_module_import(self):
-        """Test import module cli.auth"""
-        import cli.utils.auth
-
-        assert hasattr(cli.utils.auth, "__file__")
-        assert hasattr(cli.utils.auth, "auth_manager")
-
     def test_cli_auth_decorators_exist(self):
         """Test that decorators exist"""
-        from cli.utils.auth import cli_auth_required, require_permission
+        from cli.utils.auth import auth_manager, cli_auth_required, require_permission
 
+        assert auth_manager is not None
         assert cli_auth_required is not None
         assert require_permission is not None
 
@@ -33,7 +33,7 @@ class TestCreateBaseRoles:
             mock_session.commit.assert_called_once()
             mock_session.close.assert_called_once()
 
-    def test_create_base_roles_already_exist(self, test_db):
+    def test_create_base_roles_already_exist(self):
         """Test when roles already exist"""
         with patch("init_db.Session") as mock_session_class:
             mock_session = MagicMock()
@@ -69,7 +69,7 @@ class TestCreateAdminUser:
     @patch("builtins.input")
     @patch("builtins.print")
     def test_create_admin_user_success(
-        self, mock_print, mock_input, mock_getpass, test_db
+        self, mock_print, mock_input, mock_getpass
     ):
         """Test successful admin user creation"""
         # Setup mocks
@@ -265,31 +265,29 @@ class TestMain:
     @patch("init_db.create_admin_user")
     @patch("init_db.create_database")
     @patch("builtins.print")
-    def test_main_force_mode(self, mock_print, mock_create_db, mock_create_admin):
+    def test_main_force_mode(
+        self, mock_print, mock_create_db, mock_create_admin, monkeypatch
+    ):
         """Test main function with --force flag"""
         mock_create_admin.return_value = True
 
         # Mock sys.argv to include --force
-        original_argv = sys.argv
-        try:
-            sys.argv = ["init_db.py", "--force"]
-
-            with patch("init_db.Session") as mock_session_class:
-                mock_session = MagicMock()
-                mock_session_class.return_value = mock_session
-                mock_session.query.return_value.count.return_value = 4
-                mock_session.query.return_value.all.return_value = []
-
-                result = init_db.main()
-
-                assert result is True
-                mock_create_db.assert_called_once()
-                mock_create_admin.assert_called_once()
-                mock_print.assert_any_call(
-                    "Force mode: Proceeding without confirmation..."
-                )
-        finally:
-            sys.argv = original_argv
+        monkeypatch.setattr(sys, "argv", ["init_db.py", "--force"])
+
+        with patch("init_db.Session") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.query.return_value.count.return_value = 4
+            mock_session.query.return_value.all.return_value = []
+
+            result = init_db.main()
+
+            assert result is True
+            mock_create_db.assert_called_once()
+            mock_create_admin.assert_called_once()
+            mock_print.assert_any_call(
+                "Force mode: Proceeding without confirmation..."
+            )
 
     @patch("init_db.create_database")
     @patch("builtins.input")
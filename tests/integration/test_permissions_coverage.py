@@ -2,17 +2,16 @@
 Integration tests to improve permissions system coverage
 """
 
+import re
+
 import pytest
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime
 
-from models import Role
-from repositories import (
-    CustomerRepository,
-    EmployeeRepository,
-    ContractRepository,
-    EventRepository,
-)
-from services.auth import AuthService
+from sqlalchemy.orm import sessionmaker
+
+from models import Contract, Customer, Employee, Event, Role
 from utils.permissions import (
     Permission,
     PermissionError,
@@ -27,139 +26,304 @@ from utils.permissions import (
 )
 
 
-@pytest.fixture
-def permissions_session(test_db):
-    """Session for permissions tests - uses roles created in conftest.py"""
-    yield test_db
+# Tests share module-scoped employees: keep them on one xdist worker
+# when running with --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="permissions")
+
+# Fixed date for contracts and events, avoids time-dependent test data
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_employees(session, specs, password_hash):
+    """
+    Insert employees directly with a single flush, skipping password hashing
+    specs is a list of (role_id, name, email) tuples
+    password_hash is the precomputed hash shared by every employee
+    """
+    # Employee numbers are allocated up front instead of one query per row
+    first_number = int(Employee.generate_employee_number(session)[3:])
+    employees = [
+        Employee(
+            employee_number=f"EMP{first_number + offset:03d}",
+            name=name,
+            email=email,
+            role_id=role_id,
+            password_hash=password_hash,
+        )
+        for offset, (role_id, name, email) in enumerate(specs)
+    ]
+    session.add_all(employees)
+    session.flush()
+    return employees
+
+
+@pytest.fixture(scope="module")
+def permissions_connection(outer_transaction):
+    """
+    Connection shared by the whole module
+    Everything written through it is rolled back once the module is done
+    Holds the outer transaction: tests in this module must not request test_db
+    """
+    with outer_transaction() as session:
+        yield session.connection()
+
+
+@pytest.fixture(scope="module")
+def permissions_setup_session(permissions_connection):
+    """Module-level session used to build the shared fixture data"""
+    SessionClass = sessionmaker(
+        bind=permissions_connection, join_transaction_mode="create_savepoint"
+    )
+    session = SessionClass()
+
+    yield session
 
+    session.close()
 
-@pytest.fixture
-def permissions_roles(permissions_session):
+
+AUTH_REQUIRED_MESSAGE = re.compile("Authentication required")
+NO_PERMISSION_MESSAGE = re.compile("does not have permission")
+
+RoleRecord = namedtuple("RoleRecord", ["id", "name", "description"])
+
+
+@pytest.fixture(scope="module")
+def permissions_roles(permissions_setup_session):
     """Retrieve roles created in conftest.py - avoids DetachedInstanceError"""
-    roles_data = {}
-    for role_name in ["sales", "support", "management", "admin"]:
-        role = permissions_session.query(Role).filter_by(name=role_name).first()
-        if role:
-            roles_data[role_name] = {
-                "id": role.id,
-                "name": role.name,
-                "description": role.description,
-            }
-
-    # Return a dict-like object that allows accessing both id and full role
+    roles = (
+        permissions_setup_session.query(Role)
+        .filter(Role.name.in_(["sales", "support", "management", "admin"]))
+        .all()
+    )
+    roles_data = {
+        role.name: {"id": role.id, "name": role.name, "description": role.description}
+        for role in roles
+    }
+
+    # Return a dict-like object giving role records without querying again
     class RoleHelper:
 
-        def __init__(self, session, roles_data):
-            self.session = session
+        def __init__(self, roles_data):
             self.roles_data = roles_data
 
         def __getitem__(self, key):
             if key not in self.roles_data:
                 raise KeyError(f"Role '{key}' not found")
 
-            # Return fresh role object from current session
-            role_id = self.roles_data[key]["id"]
-            return self.session.query(Role).filter(Role.id == role_id).first()
+            return RoleRecord(**self.roles_data[key])
+
+    return RoleHelper(roles_data)
+
+
+@pytest.fixture(scope="module")
+def prebuilt_employees(permissions_setup_session, permissions_roles, password_hash):
+    """
+    Canonical employees created once for the module
+    Returns a dict mapping each employee key to its ID
+    """
+    employees = [
+        ("sales", "Sales Employee", "sales"),
+        ("sales2", "Sales Employee 2", "sales"),
+        ("support", "Support Employee", "support"),
+        ("management", "Management Employee", "management"),
+    ]
+
+    created = make_employees(
+        permissions_setup_session,
+        [
+            (permissions_roles[role_name].id, name, f"{key}_perms@test.com")
+            for key, name, role_name in employees
+        ],
+        password_hash,
+    )
+    employee_ids = {
+        key: employee.id for (key, _, _), employee in zip(employees, created)
+    }
+
+    permissions_setup_session.commit()
+    return employee_ids
 
-    return RoleHelper(permissions_session, roles_data)
 
+@dataclass(slots=True)
+class FakeEmployee:
+    """Minimal employee exposing only what has_permission reads"""
 
-@pytest.fixture
-def auth_service_permissions():
-    """Authentication service for permissions tests"""
-    return AuthService()
+    role: str
+    name: str
 
 
-@pytest.fixture
-def permissions_repos(permissions_session):
-    """Repositories for permissions tests"""
-    return {
-        "customer": CustomerRepository(permissions_session),
-        "employee": EmployeeRepository(permissions_session),
-        "contract": ContractRepository(permissions_session),
-        "event": EventRepository(permissions_session),
+Scenario = namedtuple(
+    "Scenario", ["sales", "support", "customer", "contract", "event"]
+)
+
+
+CustomerScenario = namedtuple("CustomerScenario", ["employees", "customers"])
+
+
+@pytest.fixture(scope="module")
+def customer_scenario(permissions_setup_session, prebuilt_employees):
+    """
+    Employees and customers built once for the module
+    Customers are keyed by the employee key of their sales contact
+    (None for an unassigned customer)
+    """
+    session = permissions_setup_session
+    employees = {
+        key: session.get(Employee, employee_id)
+        for key, employee_id in prebuilt_employees.items()
     }
 
+    customers = {
+        "sales": Customer(
+            full_name="Assigned Customer",
+            email="assigned@test.com",
+            phone="0123456789",
+            sales_contact_id=prebuilt_employees["sales"],
+        ),
+        None: Customer(
+            full_name="Any Customer",
+            email="any@test.com",
+            phone="0123456789",
+        ),
+    }
+    session.add_all(customers.values())
+    session.commit()
+
+    return CustomerScenario(employees, customers)
+
+
+@pytest.fixture(scope="module")
+def scenario(permissions_setup_session, prebuilt_employees):
+    """
+    Customer, contract and event owned by the sales and support employees
+    Built once for the module, tests only read them
+    """
+    session = permissions_setup_session
+    sales = session.get(Employee, prebuilt_employees["sales"])
+    support = session.get(Employee, prebuilt_employees["support"])
+
+    customer = Customer(
+        full_name="Scenario Customer",
+        email="scenario_customer@test.com",
+        phone="0123456789",
+    )
+    contract = Contract(
+        customer=customer,
+        sales_contact_id=sales.id,
+        total_amount=3000.0,
+        remaining_amount=1500.0,
+        date_created=FIXED_TIMESTAMP,
+        signed=True,
+    )
+    event = Event(
+        contract=contract,
+        customer=customer,
+        support_contact_id=support.id,
+        name="Test Event Permission",
+        date_start=FIXED_TIMESTAMP,
+        date_end=FIXED_TIMESTAMP,
+        location="Test Location",
+        attendees=50,
+        notes="Permission test",
+    )
+    session.add_all([customer, contract, event])
+    session.commit()
+
+    return Scenario(sales, support, customer, contract, event)
+
 
 class TestPermissions:
     """Tests to improve permissions system coverage"""
 
     def test_permission_enum_values(self):
         """Test that the Permission enumeration contains the correct values"""
-        # Check that all permissions exist
-        assert Permission.CREATE_CUSTOMER.value == "create_customer"
-        assert Permission.READ_CUSTOMER.value == "read_customer"
-        assert Permission.UPDATE_CUSTOMER.value == "update_customer"
-        assert Permission.DELETE_CUSTOMER.value == "delete_customer"
-
-        assert Permission.CREATE_EMPLOYEE.value == "create_employee"
-        assert Permission.READ_EMPLOYEE.value == "read_employee"
-        assert Permission.UPDATE_EMPLOYEE.value == "update_employee"
-        assert Permission.DELETE_EMPLOYEE.value == "delete_employee"
-
-    def test_role_permissions_sales(self):
-        """Test permissions of the sales role"""
-        sales_permissions = ROLE_PERMISSIONS["sales"]
-
-        # Sales can create/read/update customers
-        assert Permission.CREATE_CUSTOMER in sales_permissions
-        assert Permission.READ_CUSTOMER in sales_permissions
-        assert Permission.UPDATE_CUSTOMER in sales_permissions
-        # But not delete
-        assert Permission.DELETE_CUSTOMER not in sales_permissions
-
-        # Sales can read and update contracts (but not create or sign)
-        assert Permission.CREATE_CONTRACT not in sales_permissions
-        assert Permission.READ_CONTRACT in sales_permissions
-        assert Permission.UPDATE_CONTRACT in sales_permissions
-        assert Permission.SIGN_CONTRACT not in sales_permissions
-
-    def test_role_permissions_support(self):
-        """Test permissions of the support role"""
-        support_permissions = ROLE_PERMISSIONS["support"]
-
-        # Support can only read customers
-        assert Permission.READ_CUSTOMER in support_permissions
-        assert Permission.CREATE_CUSTOMER not in support_permissions
-        assert Permission.UPDATE_CUSTOMER not in support_permissions
-        assert Permission.DELETE_CUSTOMER not in support_permissions
-
-        # Support can read and update events
-        assert Permission.READ_EVENT in support_permissions
-        assert Permission.UPDATE_EVENT in support_permissions
-        assert Permission.CREATE_EVENT not in support_permissions
-
-    def test_role_permissions_management(self):
-        """Test permissions of the management role"""
-        management_permissions = ROLE_PERMISSIONS["management"]
-
-        # Management has all permissions
-        all_permissions = list(Permission)
-        for permission in all_permissions:
-            assert permission in management_permissions
-
-    def test_has_permission_with_valid_employee(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
+        # Check that all customer and employee permissions exist
+        values = {
+            permission.name: permission.value
+            for permission in Permission
+            if permission.name.endswith(("CUSTOMER", "EMPLOYEE"))
+        }
+
+        assert values == {
+            "CREATE_CUSTOMER": "create_customer",
+            "READ_CUSTOMER": "read_customer",
+            "UPDATE_CUSTOMER": "update_customer",
+            "DELETE_CUSTOMER": "delete_customer",
+            "CREATE_EMPLOYEE": "create_employee",
+            "READ_EMPLOYEE": "read_employee",
+            "UPDATE_EMPLOYEE": "update_employee",
+            "DELETE_EMPLOYEE": "delete_employee",
+        }
+
+    @pytest.mark.parametrize(
+        "role,granted,denied",
+        [
+            (
+                "sales",
+                # Sales can create/read/update customers,
+                # read and update contracts
+                {
+                    Permission.CREATE_CUSTOMER,
+                    Permission.READ_CUSTOMER,
+                    Permission.UPDATE_CUSTOMER,
+                    Permission.READ_CONTRACT,
+                    Permission.UPDATE_CONTRACT,
+                },
+                # But not delete customers, nor create or sign contracts
+                {
+                    Permission.DELETE_CUSTOMER,
+                    Permission.CREATE_CONTRACT,
+                    Permission.SIGN_CONTRACT,
+                },
+            ),
+            (
+                "support",
+                # Support can only read customers, read and update events
+                {
+                    Permission.READ_CUSTOMER,
+                    Permission.READ_EVENT,
+                    Permission.UPDATE_EVENT,
+                },
+                {
+                    Permission.CREATE_CUSTOMER,
+                    Permission.UPDATE_CUSTOMER,
+                    Permission.DELETE_CUSTOMER,
+                    Permission.CREATE_EVENT,
+                },
+            ),
+            # Management has all permissions
+            ("management", set(Permission), set()),
+        ],
+    )
+    def test_role_permissions(self, role, granted, denied):
+        """Test permissions granted and denied to each role"""
+        role_permissions = ROLE_PERMISSIONS[role]
+
+        assert granted <= role_permissions
+        assert role_permissions.isdisjoint(denied)
+
+    def test_has_permission_with_valid_employee(self):
         """Test has_permission with valid employee"""
-        # Create a sales employee
-        sales_data = auth_service_permissions.create_employee_with_password(
-            name="Sales Employee",
-            email="sales_perms@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-        sales_employee = permissions_repos["employee"].get_by_id(sales_data["id"])
-
-        # Test granted permissions
-        assert has_permission(sales_employee, Permission.CREATE_CUSTOMER) is True
-        assert has_permission(sales_employee, Permission.READ_CUSTOMER) is True
-        assert has_permission(sales_employee, Permission.UPDATE_CONTRACT) is True
-
-        # Test denied permissions (corrected)
-        assert has_permission(sales_employee, Permission.CREATE_CONTRACT) is False
-        assert has_permission(sales_employee, Permission.DELETE_CUSTOMER) is False
-        assert has_permission(sales_employee, Permission.DELETE_EMPLOYEE) is False
+        sales_employee = FakeEmployee(role="sales", name="Sales Employee")
+
+        expected_granted = {
+            Permission.CREATE_CUSTOMER,
+            Permission.READ_CUSTOMER,
+            Permission.UPDATE_CONTRACT,
+        }
+        expected_denied = {
+            Permission.CREATE_CONTRACT,
+            Permission.DELETE_CUSTOMER,
+            Permission.DELETE_EMPLOYEE,
+        }
+
+        # Only the expected permissions are granted
+        granted = {
+            permission
+            for permission in expected_granted | expected_denied
+            if has_permission(sales_employee, permission)
+        }
+        assert granted == expected_granted
 
     def test_has_permission_with_none_employee(self):
         """Test has_permission with None employee"""
@@ -168,31 +332,32 @@ class TestPermissions:
 
     def test_has_permission_with_invalid_role(self):
         """Test has_permission with invalid role"""
-        # Create a mock employee with an invalid role
-        mock_employee = type(
-            "MockEmployee",
-            (),
-            {
-                "role": "invalid_role",  # RRole that does not exist in ROLE_PERMISSIONS
-                "name": "Test Employee",
-            },
-        )()
+        # Role that does not exist in ROLE_PERMISSIONS
+        mock_employee = FakeEmployee(role="invalid_role", name="Test Employee")
 
         # An invalid role should return False
         assert has_permission(mock_employee, Permission.CREATE_CUSTOMER) is False
 
-    def test_require_permission_success(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
-        """Test require_permission with granted permission"""
-        # Create a management employee
-        mgmt_data = auth_service_permissions.create_employee_with_password(
-            name="Management Employee",
-            email="mgmt_perms@test.com",
-            role_id=permissions_roles["management"].id,
-            password="TestPassword123!",
+    def test_has_permission_follows_role_permission_changes(self, monkeypatch):
+        """Test has_permission reads ROLE_PERMISSIONS at call time"""
+        mgmt_employee = FakeEmployee(role="Management", name="Management Employee")
+        assert has_permission(mgmt_employee, Permission.DELETE_EMPLOYEE) is True
+
+        monkeypatch.setitem(ROLE_PERMISSIONS, "management", frozenset())
+
+        assert has_permission(mgmt_employee, Permission.DELETE_EMPLOYEE) is False
+
+    def test_get_role_permissions_follows_role_permission_changes(self, monkeypatch):
+        """Test get_role_permissions reads ROLE_PERMISSIONS at call time"""
+        monkeypatch.setitem(
+            ROLE_PERMISSIONS, "support", frozenset({Permission.READ_EVENT})
         )
-        mgmt_employee = permissions_repos["employee"].get_by_id(mgmt_data["id"])
+
+        assert get_role_permissions("support") == [Permission.READ_EVENT]
+
+    def test_require_permission_success(self):
+        """Test require_permission with granted permission"""
+        mgmt_employee = FakeEmployee(role="management", name="Management Employee")
 
         # Should not raise an exception
         require_permission(mgmt_employee, Permission.DELETE_CUSTOMER)
@@ -200,110 +365,36 @@ class TestPermissions:
 
     def test_require_permission_failure_none_employee(self):
         """Test require_permission with None employee"""
-        with pytest.raises(PermissionError, match="Authentication required"):
+        with pytest.raises(PermissionError, match=AUTH_REQUIRED_MESSAGE):
             require_permission(None, Permission.CREATE_CUSTOMER)
 
-    def test_require_permission_insufficient_permission(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
+    def test_require_permission_insufficient_permission(self):
         """Test require_permission with insufficient permission"""
-        # Create a support employee
-        support_data = auth_service_permissions.create_employee_with_password(
-            name="Support Employee",
-            email="support_perms@test.com",
-            role_id=permissions_roles["support"].id,
-            password="TestPassword123!",
-        )
-        support_employee = permissions_repos["employee"].get_by_id(support_data["id"])
+        support_employee = FakeEmployee(role="support", name="Support Employee")
 
         # Should raise an exception
-        with pytest.raises(PermissionError, match="does not have permission"):
+        with pytest.raises(PermissionError, match=NO_PERMISSION_MESSAGE):
             require_permission(support_employee, Permission.DELETE_CUSTOMER)
 
-    def test_can_update_own_assigned_customer_success(
-        self, permissions_roles, auth_service_permissions, permissions_repos
+    @pytest.mark.parametrize(
+        "actor,owner,expected",
+        [
+            # Sales can update their assigned customer
+            ("sales", "sales", True),
+            # Another sales cannot update it
+            ("sales2", "sales", False),
+            # Management can update any customer
+            ("management", None, True),
+        ],
+    )
+    def test_can_update_own_assigned_customer(
+        self, customer_scenario, actor, owner, expected
     ):
-        """Test can_update_own_assigned_customer with assigned customer"""
-        # Create sales employee
-        sales_data = auth_service_permissions.create_employee_with_password(
-            name="Sales Assigned",
-            email="sales_assigned@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-        sales_employee = permissions_repos["employee"].get_by_id(sales_data["id"])
-
-        # Create assigned customer for this employee
-        customer = permissions_repos["customer"].create(
-            {
-                "full_name": "Assigned Customer",
-                "email": "assigned@test.com",
-                "phone": "0123456789",
-                "sales_contact_id": sales_employee.id,
-            }
-        )
-
-        # Sales can update their assigned customer
-        assert can_update_own_assigned_customer(sales_employee, customer) is True
-
-    def test_can_update_own_assigned_customer_failure(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
-        """Test can_update_own_assigned_customer with unassigned customer"""
-        # Create two sales employees
-        sales1_data = auth_service_permissions.create_employee_with_password(
-            name="Sales 1",
-            email="sales1_assigned@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-        sales2_data = auth_service_permissions.create_employee_with_password(
-            name="Sales 2",
-            email="sales2_assigned@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-
-        sales1_employee = permissions_repos["employee"].get_by_id(sales1_data["id"])
-        sales2_employee = permissions_repos["employee"].get_by_id(sales2_data["id"])
-
-        # Create assigned customer for sales1
-        customer = permissions_repos["customer"].create(
-            {
-                "full_name": "Other Customer",
-                "email": "other@test.com",
-                "phone": "0123456789",
-                "sales_contact_id": sales1_employee.id,
-            }
-        )
-
-        # Sales2 cannot update sales1's customer
-        assert can_update_own_assigned_customer(sales2_employee, customer) is False
-
-    def test_can_update_own_assigned_customer_management(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
-        """Test can_update_own_assigned_customer with management role"""
-        # Create management employee
-        mgmt_data = auth_service_permissions.create_employee_with_password(
-            name="Manager",
-            email="manager_assigned@test.com",
-            role_id=permissions_roles["management"].id,
-            password="TestPassword123!",
-        )
-        manager = permissions_repos["employee"].get_by_id(mgmt_data["id"])
-
-        # Create any customer
-        customer = permissions_repos["customer"].create(
-            {
-                "full_name": "Any Customer",
-                "email": "any@test.com",
-                "phone": "0123456789",
-            }
-        )
+        """Test can_update_own_assigned_customer for each actor/owner pair"""
+        employee = customer_scenario.employees[actor]
+        customer = customer_scenario.customers[owner]
 
-        # Management can update any customer
-        assert can_update_own_assigned_customer(manager, customer) is True
+        assert can_update_own_assigned_customer(employee, customer) is expected
 
     def test_can_update_with_none_parameters(self):
         """Test can_update methods with None parameters"""
@@ -354,106 +445,23 @@ class TestPermissions:
             or "Invalid role" in invalid_desc
         )
 
-    def test_can_update_own_assigned_contract(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
+    def test_can_update_own_assigned_contract(self, scenario):
         """Test can_update_own_assigned_contract method"""
-        # Create sales employee
-        sales_data = auth_service_permissions.create_employee_with_password(
-            name="Sales Contract",
-            email="sales_contract@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-        sales_employee = permissions_repos["employee"].get_by_id(sales_data["id"])
-
-        # Create customer and contract
-        customer = permissions_repos["customer"].create(
-            {
-                "full_name": "Contract Customer",
-                "email": "contract_customer@test.com",
-                "phone": "0123456789",
-            }
-        )
-
-        contract = permissions_repos["contract"].create(
-            {
-                "customer_id": customer.id,
-                "sales_contact_id": sales_employee.id,
-                "total_amount": 5000.0,
-                "remaining_amount": 2500.0,
-                "date_created": datetime.now(),
-                "signed": False,
-            }
-        )
-
         # Sales can update their own contract
-        assert can_update_own_assigned_contract(sales_employee, contract) is True
+        contract = scenario.contract
+        assert can_update_own_assigned_contract(scenario.sales, contract) is True
 
         # Test with None
         assert can_update_own_assigned_contract(None, contract) is False
-        assert can_update_own_assigned_contract(sales_employee, None) is False
+        assert can_update_own_assigned_contract(scenario.sales, None) is False
 
-    def test_can_update_own_assigned_event(
-        self, permissions_roles, auth_service_permissions, permissions_repos
-    ):
+    def test_can_update_own_assigned_event(self, scenario):
         """Test can_update_own_assigned_event method"""
-        # Create employees
-        sales_data = auth_service_permissions.create_employee_with_password(
-            name="Sales Event Test",
-            email="sales_event_test@test.com",
-            role_id=permissions_roles["sales"].id,
-            password="TestPassword123!",
-        )
-        support_data = auth_service_permissions.create_employee_with_password(
-            name="Support Event Test",
-            email="support_event_test@test.com",
-            role_id=permissions_roles["support"].id,
-            password="TestPassword123!",
-        )
-
-        sales_employee = permissions_repos["employee"].get_by_id(sales_data["id"])
-        support_employee = permissions_repos["employee"].get_by_id(support_data["id"])
-
-        # Create customer, contract and event
-        customer = permissions_repos["customer"].create(
-            {
-                "full_name": "Event Customer",
-                "email": "event_customer@test.com",
-                "phone": "0123456789",
-            }
-        )
-
-        contract = permissions_repos["contract"].create(
-            {
-                "customer_id": customer.id,
-                "sales_contact_id": sales_employee.id,
-                "total_amount": 3000.0,
-                "remaining_amount": 1500.0,
-                "date_created": datetime.now(),
-                "signed": True,
-            }
-        )
-
-        event = permissions_repos["event"].create(
-            {
-                "contract_id": contract.id,
-                "customer_id": customer.id,
-                "support_contact_id": support_employee.id,
-                "name": "Test Event Permission",
-                "date_start": datetime.now(),
-                "date_end": datetime.now(),
-                "location": "Test Location",
-                "attendees": 50,
-                "notes": "Permission test",
-            }
-        )
-
         # Support can update their assigned event
-        assert can_update_own_assigned_event(support_employee, event) is True
+        assert can_update_own_assigned_event(scenario.support, scenario.event) is True
 
         # Sales cannot update the event assigned to support
-        assert can_update_own_assigned_event(sales_employee, event) is False
+        assert can_update_own_assigned_event(scenario.sales, scenario.event) is False
 
         # Test with None
-        assert can_update_own_assigned_event(None, event) is False
+        assert can_update_own_assigned_event(None, scenario.event) is False
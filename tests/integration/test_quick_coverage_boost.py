@@ -2,63 +2,59 @@
 tests for quickly boosting coverage to 80%
 """
 
+import click
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from sqlalchemy.exc import SQLAlchemyError
 
+from cli.utils.auth import auth_manager, get_current_user
+from cli.utils.error_handling import handle_cli_errors
+from models.employee import Employee
+from repositories.base import BaseRepository
+from repositories.contract import ContractRepository
+from repositories.employee import EmployeeRepository
+from repositories.event import EventRepository
+from services.contract import ContractService
+from services.customer import CustomerService
+from services.employee import EmployeeService
+from services.event import EventService
+from utils.permissions import PermissionError
+from utils.validators import ValidationError
+
 
 class TestCLIErrorHandlingCoverage:
     """Tests to improve the coverage of cli.error_handling (36% → 50%+)"""
 
-    def test_handle_cli_errors_decorator_success(self):
-        """Test decorator handle_cli_errors without error"""
-        from cli.utils.error_handling import handle_cli_errors
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValidationError("Test validation error"),
+            PermissionError("Test permission error"),
+            SQLAlchemyError("Database error"),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_handle_cli_errors_aborts(self, error):
+        """Test decorator handle_cli_errors with each handled error"""
 
         @handle_cli_errors
         def test_function():
-            return "success"
-
-        result = test_function()
-        assert result == "success"
-
-    def test_handle_cli_errors_validation_error(self):
-        """Test decorator with ValidationError"""
-        from cli.utils.error_handling import handle_cli_errors
-        from utils.validators import ValidationError
-        import click
-
-        @handle_cli_errors
-        def test_function():
-            raise ValidationError("Test validation error")
+            raise error
 
         # The decorator should raise click.Abort after handling the error
         with pytest.raises(click.Abort):
             test_function()
 
-    def test_handle_cli_errors_permission_error(self):
-        """Test decorator with PermissionError"""
-        from cli.utils.error_handling import handle_cli_errors
-        from utils.permissions import PermissionError
-        import click
-
-        @handle_cli_errors
-        def test_function():
-            raise PermissionError("Test permission error")
-
-        with pytest.raises(click.Abort):
-            test_function()
-
-    def test_handle_cli_errors_sqlalchemy_error(self):
-        """Test decorator with SQLAlchemyError"""
-        from cli.utils.error_handling import handle_cli_errors
-        import click
+    def test_handle_cli_errors_decorator_success(self):
+        """Test decorator handle_cli_errors without error"""
 
         @handle_cli_errors
         def test_function():
-            raise SQLAlchemyError("Database error")
+            return "success"
 
-        with pytest.raises(click.Abort):
-            test_function()
+        result = test_function()
+        assert result == "success"
 
 
 class TestCustomerServiceCoverage:
@@ -66,10 +62,7 @@ class TestCustomerServiceCoverage:
 
     def test_customer_service_initialization(self):
         """Test initialization CustomerService"""
-        from services.customer import CustomerService
-        from repositories.customer import CustomerRepository
-
-        mock_repo = MagicMock(spec=CustomerRepository)
+        mock_repo = SimpleNamespace()
         service = CustomerService(mock_repo)
         assert service.repository == mock_repo
 
@@ -79,9 +72,6 @@ class TestRepositoryBaseCoverage:
 
     def test_base_repository_initialization(self):
         """Test initialization BaseRepository"""
-        from repositories.base import BaseRepository
-        from models.employee import Employee
-
         mock_session = MagicMock()
         repo = BaseRepository(Employee, mock_session)
 
@@ -95,8 +85,6 @@ class TestCLIAuthCoverage:
 
     def test_get_current_user_not_authenticated(self):
         """Test get_current_user when not authenticated"""
-        from cli.utils.auth import get_current_user
-
         with patch("cli.utils.auth.auth_manager") as mock_auth:
             mock_auth.get_current_user.return_value = None
 
@@ -105,8 +93,6 @@ class TestCLIAuthCoverage:
 
     def test_auth_manager_import(self):
         """Test import auth_manager"""
-        from cli.utils.auth import auth_manager
-
         assert auth_manager is not None
 
 
@@ -115,8 +101,6 @@ class TestServicesCoverage:
 
     def test_employee_service_edge_cases(self):
         """Test edge cases EmployeeService"""
-        from services.employee import EmployeeService
-
         mock_repo = MagicMock()
         service = EmployeeService(mock_repo)
 
@@ -129,9 +113,7 @@ class TestServicesCoverage:
 
     def test_contract_service_edge_cases(self):
         """Test edge cases ContractService"""
-        from services.contract import ContractService
-
-        mock_repo = MagicMock()
+        mock_repo = SimpleNamespace()
         service = ContractService(mock_repo)
 
         # Test initialisation
@@ -139,9 +121,7 @@ class TestServicesCoverage:
 
     def test_event_service_edge_cases(self):
         """Test edge cases EventService"""
-        from services.event import EventService
-
-        mock_repo = MagicMock()
+        mock_repo = SimpleNamespace()
         service = EventService(mock_repo)
 
         # Test initialisation
@@ -151,22 +131,16 @@ class TestServicesCoverage:
 class TestRepositoriesCoverage:
     """Tests to improve the coverage of repositories"""
 
-    def test_employee_repository_edge_cases(self):
+    def test_employee_repository_edge_cases(self, empty_query_db):
         """Test edge cases EmployeeRepository"""
-        from repositories.employee import EmployeeRepository
+        repo = EmployeeRepository(empty_query_db)
 
-        mock_db = MagicMock()
-        repo = EmployeeRepository(mock_db)
-
-        # Test get_all sans résultat - need to mock order_by chain
-        mock_db.query.return_value.order_by.return_value.all.return_value = []
+        # Test get_all sans résultat
         result = repo.get_all()
         assert result == []
 
     def test_contract_repository_initialization(self):
         """Test initialisation ContractRepository"""
-        from repositories.contract import ContractRepository
-
         mock_db = MagicMock()
         repo = ContractRepository(mock_db)
 
@@ -175,8 +149,6 @@ class TestRepositoriesCoverage:
 
     def test_event_repository_initialization(self):
         """Test initialisation EventRepository"""
-        from repositories.event import EventRepository
-
         mock_db = MagicMock()
         repo = EventRepository(mock_db)
 
@@ -11,13 +11,15 @@ from models import Role
 @pytest.fixture
 def mock_session():
     """Mock database session for unit tests"""
-    session = MagicMock()
-    session.query.return_value.filter.return_value.first.return_value = None
-    session.query.return_value.all.return_value = []
-    session.commit.return_value = None
-    session.rollback.return_value = None
-    session.close.return_value = None
-    return session
+    return MagicMock(
+        **{
+            "query.return_value.filter.return_value.first.return_value": None,
+            "query.return_value.all.return_value": [],
+            "commit.return_value": None,
+            "rollback.return_value": None,
+            "close.return_value": None,
+        }
+    )
 
 
 @pytest.fixture
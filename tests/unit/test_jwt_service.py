@@ -19,18 +19,6 @@ class TestJWTService:
         """Create JWT service instance"""
         return JWTService()
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """Sample employee data for testing"""
-        return {
-            "id": 1,
-            "employee_number": "EMP001",
-            "name": "Test User",
-            "email": "test@example.com",
-            "role": "admin",
-            "role_id": 4,
-        }
-
     @pytest.fixture
     def mock_env_secret(self):
         """Mock environment secret"""
@@ -18,18 +18,6 @@ class TestJWTServiceSimple:
         """Create JWT service instance"""
         return JWTService()
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """Sample employee data for testing"""
-        return {
-            "id": 1,
-            "employee_number": "EMP001",
-            "name": "Test User",
-            "email": "test@example.com",
-            "role": "admin",
-            "role_id": 4,
-        }
-
     def test_create_access_token(self, jwt_service, sample_employee_data):
         """Test creating access token"""
         with patch.dict(os.environ, {"EPIC_EVENTS_JWT_SECRET": "test_secret_key"}):
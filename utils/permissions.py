@@ -44,78 +44,89 @@ class PermissionError(Exception):
 
 
 # Permission definitions by role
+# frozensets give O(1) membership checks in has_permission
 ROLE_PERMISSIONS = {
-    "sales": [
-        # Customers: create and update (not delete)
-        Permission.CREATE_CUSTOMER,
-        Permission.READ_CUSTOMER,
-        Permission.UPDATE_CUSTOMER,
-        # Employees: read only
-        Permission.READ_EMPLOYEE,
-        # Contracts: read and update only (management creates and signs)
-        Permission.READ_CONTRACT,
-        Permission.UPDATE_CONTRACT,
-        # Events: read and create
-        Permission.CREATE_EVENT,
-        Permission.READ_EVENT,
-        # No UPDATE/DELETE for sales
-    ],
-    "support": [
-        # Customers: read only
-        Permission.READ_CUSTOMER,
-        # Employees: read only
-        Permission.READ_EMPLOYEE,
-        # Contracts: read only
-        Permission.READ_CONTRACT,
-        # Events: read and update (for assigned events)
-        Permission.READ_EVENT,
-        Permission.UPDATE_EVENT,
-        # No CREATE/DELETE for support
-    ],
-    "management": [
-        # Management has ALL permissions
-        Permission.CREATE_CUSTOMER,
-        Permission.READ_CUSTOMER,
-        Permission.UPDATE_CUSTOMER,
-        Permission.DELETE_CUSTOMER,
-        Permission.CREATE_EMPLOYEE,
-        Permission.READ_EMPLOYEE,
-        Permission.UPDATE_EMPLOYEE,
-        Permission.DELETE_EMPLOYEE,
-        Permission.CREATE_CONTRACT,
-        Permission.READ_CONTRACT,
-        Permission.UPDATE_CONTRACT,
-        Permission.DELETE_CONTRACT,
-        Permission.SIGN_CONTRACT,
-        Permission.CREATE_EVENT,
-        Permission.READ_EVENT,
-        Permission.UPDATE_EVENT,
-        Permission.DELETE_EVENT,
-        Permission.ASSIGN_SUPPORT,
-    ],
-    "admin": [
-        # admin has ALL permissions
-        Permission.CREATE_CUSTOMER,
-        Permission.READ_CUSTOMER,
-        Permission.UPDATE_CUSTOMER,
-        Permission.DELETE_CUSTOMER,
-        Permission.CREATE_EMPLOYEE,
-        Permission.READ_EMPLOYEE,
-        Permission.UPDATE_EMPLOYEE,
-        Permission.DELETE_EMPLOYEE,
-        Permission.CREATE_CONTRACT,
-        Permission.READ_CONTRACT,
-        Permission.UPDATE_CONTRACT,
-        Permission.DELETE_CONTRACT,
-        Permission.SIGN_CONTRACT,
-        Permission.CREATE_EVENT,
-        Permission.READ_EVENT,
-        Permission.UPDATE_EVENT,
-        Permission.DELETE_EVENT,
-        Permission.ASSIGN_SUPPORT,
-    ],
+    "sales": frozenset(
+        {
+            # Customers: create and update (not delete)
+            Permission.CREATE_CUSTOMER,
+            Permission.READ_CUSTOMER,
+            Permission.UPDATE_CUSTOMER,
+            # Employees: read only
+            Permission.READ_EMPLOYEE,
+            # Contracts: read and update only (management creates and signs)
+            Permission.READ_CONTRACT,
+            Permission.UPDATE_CONTRACT,
+            # Events: read and create
+            Permission.CREATE_EVENT,
+            Permission.READ_EVENT,
+            # No UPDATE/DELETE for sales
+        }
+    ),
+    "support": frozenset(
+        {
+            # Customers: read only
+            Permission.READ_CUSTOMER,
+            # Employees: read only
+            Permission.READ_EMPLOYEE,
+            # Contracts: read only
+            Permission.READ_CONTRACT,
+            # Events: read and update (for assigned events)
+            Permission.READ_EVENT,
+            Permission.UPDATE_EVENT,
+            # No CREATE/DELETE for support
+        }
+    ),
+    "management": frozenset(
+        {
+            # Management has ALL permissions
+            Permission.CREATE_CUSTOMER,
+            Permission.READ_CUSTOMER,
+            Permission.UPDATE_CUSTOMER,
+            Permission.DELETE_CUSTOMER,
+            Permission.CREATE_EMPLOYEE,
+            Permission.READ_EMPLOYEE,
+            Permission.UPDATE_EMPLOYEE,
+            Permission.DELETE_EMPLOYEE,
+            Permission.CREATE_CONTRACT,
+            Permission.READ_CONTRACT,
+            Permission.UPDATE_CONTRACT,
+            Permission.DELETE_CONTRACT,
+            Permission.SIGN_CONTRACT,
+            Permission.CREATE_EVENT,
+            Permission.READ_EVENT,
+            Permission.UPDATE_EVENT,
+            Permission.DELETE_EVENT,
+            Permission.ASSIGN_SUPPORT,
+        }
+    ),
+    "admin": frozenset(
+        {
+            # admin has ALL permissions
+            Permission.CREATE_CUSTOMER,
+            Permission.READ_CUSTOMER,
+            Permission.UPDATE_CUSTOMER,
+            Permission.DELETE_CUSTOMER,
+            Permission.CREATE_EMPLOYEE,
+            Permission.READ_EMPLOYEE,
+            Permission.UPDATE_EMPLOYEE,
+            Permission.DELETE_EMPLOYEE,
+            Permission.CREATE_CONTRACT,
+            Permission.READ_CONTRACT,
+            Permission.UPDATE_CONTRACT,
+            Permission.DELETE_CONTRACT,
+            Permission.SIGN_CONTRACT,
+            Permission.CREATE_EVENT,
+            Permission.READ_EVENT,
+            Permission.UPDATE_EVENT,
+            Permission.DELETE_EVENT,
+            Permission.ASSIGN_SUPPORT,
+        }
+    ),
 }
 
+_NO_PERMISSIONS = frozenset()
+
 
 def has_permission(employee, permission: Permission) -> bool:
     """
@@ -133,15 +144,16 @@ def has_permission(employee, permission: Permission) -> bool:
 
     # Handle both Employee objects and dicts
     if isinstance(employee, dict):
-        role = employee.get("role", "").lower()
+        role = employee.get("role")
     else:
         # Employee object
-        role = employee.role.lower() if employee.role else None
+        role = getattr(employee, "role", None)
 
-    if role not in ROLE_PERMISSIONS:
+    # No role: deny without looking up the permissions
+    if not role:
         return False
 
-    return permission in ROLE_PERMISSIONS[role]
+    return permission in ROLE_PERMISSIONS.get(role.lower(), _NO_PERMISSIONS)
 
 
 def require_permission(employee, permission: Permission) -> None:
@@ -174,31 +186,49 @@ def require_permission(employee, permission: Permission) -> None:
         )
 
 
-def can_update_own_assigned_customer(employee: Optional[Employee], customer) -> bool:
+def _can_update_own_assigned(
+    employee: Optional[Employee], obj, owner_role: str, owner_attr: str
+) -> bool:
     """
-    Checks if a sales employee can update THEIR assigned customer
+    Checks if an employee can update an object assigned to them
 
     Args:
         employee: The employee to check
-        customer: The customer to update
+        obj: The object to update
+        owner_role: Role allowed to update the objects assigned to it
+        owner_attr: Attribute of obj holding the assigned employee id
 
     Returns:
-        True if the employee can update this customer
+        True if the employee can update this object
     """
-    if employee is None or customer is None:
+    if employee is None or obj is None:
         return False
 
     # Management can do everything
     if employee.role == "management":
         return True
 
-    # Sales can update their own customers
-    if employee.role == "sales":
-        return customer.sales_contact_id == employee.id
+    # The owner role can update its own objects
+    if employee.role == owner_role:
+        return getattr(obj, owner_attr) == employee.id
 
     return False
 
 
+def can_update_own_assigned_customer(employee: Optional[Employee], customer) -> bool:
+    """
+    Checks if a sales employee can update THEIR assigned customer
+
+    Args:
+        employee: The employee to check
+        customer: The customer to update
+
+    Returns:
+        True if the employee can update this customer
+    """
+    return _can_update_own_assigned(employee, customer, "sales", "sales_contact_id")
+
+
 def can_update_own_assigned_contract(employee: Optional[Employee], contract) -> bool:
     """
     Checks if a sales employee can update THEIR assigned contract
@@ -210,18 +240,7 @@ def can_update_own_assigned_contract(employee: Optional[Employee], contract) ->
     Returns:
         True if the employee can update this contract
     """
-    if employee is None or contract is None:
-        return False
-
-    # Management can do everything
-    if employee.role == "management":
-        return True
-
-    # Sales can update their own contracts
-    if employee.role == "sales":
-        return contract.sales_contact_id == employee.id
-
-    return False
+    return _can_update_own_assigned(employee, contract, "sales", "sales_contact_id")
 
 
 def can_update_own_assigned_event(employee: Optional[Employee], event) -> bool:
@@ -235,18 +254,7 @@ def can_update_own_assigned_event(employee: Optional[Employee], event) -> bool:
     Returns:
         True if the employee can update this event
     """
-    if employee is None or event is None:
-        return False
-
-    # Management can do everything
-    if employee.role == "management":
-        return True
-
-    # Support can update their own events
-    if employee.role == "support":
-        return event.support_contact_id == employee.id
-
-    return False
+    return _can_update_own_assigned(employee, event, "support", "support_contact_id")
 
 
 def get_role_permissions(role: str) -> list:
@@ -257,10 +265,12 @@ def get_role_permissions(role: str) -> list:
         role: The role
 
     Returns:
-        List of permissions
+        List of permissions, in Permission declaration order
     """
     role = role.lower() if role else None
-    return ROLE_PERMISSIONS.get(role, [])
+    perms = ROLE_PERMISSIONS.get(role, _NO_PERMISSIONS)
+    # frozensets are unordered: follow the Permission declaration order
+    return [perm for perm in Permission if perm in perms]
 
 
 def describe_permissions(role: str) -> str: